@@ -54,27 +54,25 @@ Functions
 
 # Python
 import re
+import sys
+import csv
+import itertools
 import warnings
 import os
 from collections import OrderedDict
-from functools import partial
+from functools import lru_cache
+from types import MethodType
 
 # self
+from PyPoE import DATA_DIR
 from PyPoE.cli.core import console, Msg
 from PyPoE.cli.exporter import config
 from PyPoE.cli.exporter.util import get_content_ggpk_path
 from PyPoE.poe.constants import MOD_DOMAIN, WORDLISTS, MOD_STATS_RANGE
 from PyPoE.poe.text import parse_description_tags
 from PyPoE.poe.file.dat import RelationalReader, set_default_spec
-from PyPoE.poe.file.translations import (
-    TranslationFileCache,
-    MissingIdentifierWarning,
-    get_custom_translation_file,
-    install_data_dependant_quantifiers,
-)
 from PyPoE.poe.file.ggpk import GGPKFile, extract_dds
 from PyPoE.poe.file.ot import OTFileCache
-from PyPoE.poe.sim.mods import get_translation_file_from_domain
 
 # =============================================================================
 # Globals
@@ -93,604 +91,301 @@ __all__ = [
 
 DEFAULT_INDENT = 32
 
-_inter_wiki_map = {
-    'English': (
-        #
-        # Attibutes
-        #
-        ('Dexterity', {'link': 'Dexterity'}),
-        ('Intelligence', {'link': 'Intelligence'}),
-        ('Strength', {'link': 'Strength'}),
-        #
-        # Offense stats
-        #
-        ('Accuracy Rating', {'link': 'Accuracy Rating'}),
-        ('Accuracy', {'link': 'Accuracy'}),
-        ('Attack Speed', {'link': 'Attack Speed'}),
-        ('Cast Speed', {'link': 'Cast Speed'}),
-        ('Critical Strike Chance', {'link': 'Critical Strike Chance'}),
-        ('Critical Strike Multiplier', {'link': 'Critical Strike Multiplier'}),
-        ('Critical Strike', {'link': 'Critical Strike'}),
-        ('Movement Speed', {'link': 'Movement Speed'}),
-        ('Leech', {'link': 'Leech'}), # Life Leech, Mana Leech
-        ('Low Life', {'link': 'Low Life'}),
-        ('Full Life', {'link': 'Full Life'}),
-        ('Life', {'link': 'Life'}),
-        ('Mana Reservation', {'link': 'Mana Reservation'}),
-        ('Low Mana', {'link': 'Low Mana'}),
-        ('Full Mana', {'link': 'Full Mana'}),
-        ('Mana', {'link': 'Mana'}),
-        # Just damage
-        #('Damage', {'link': 'Damage'}),
-        #
-        # Defenses
-        #
-        ('Armour Rating', {'link': 'Armour Rating'}),
-        ('Armour', {'link': 'Armour'}),
-        ('Energy Shield', {'link': 'Energy Shield'}),
-        ('Evasion Rating', {'link': 'Evasion Rating'}),
-        ('Evasion', {'link': 'Evasion'}),
-        ('Spell Block', {'link': 'Spell Block'}),
-        ('Block', {'link': 'Block'}),
-        ('Spell Dodge', {'link': 'Spell Dodge'}),
-        ('Dodge', {'link': 'Dodge'}),
-        #
-        ('Chaos Resistance(?:|s)', {'link': 'Chaos Resistance'}),
-        ('Cold Resistance(?:|s)', {'link': 'Cold Resistance'}),
-        ('Fire Resistance(?:|s)', {'link': 'Fire Resistance'}),
-        ('Lightning Resistance(?:|s)', {'link': 'Lightning Resistance'}),
-        ('Elemental Resistance(?:|s)', {'link': 'Elemental Resistance'}),
-        #
-        # Buffs
-        #
-
-        # Charges
-        ('Endurance Charge(?:|s)', {'link': 'Endurance Charge'}),
-        ('Frenzy Charge(?:|s)', {'link': 'Frenzy Charge'}),
-        ('Power Charge(?:|s)', {'link': 'Power Charge'}),
-
-        # Friendly
-        ('Rampage', {'link': 'Rampage'}),
-
-        # Hostile
-        ('Corrupted Blood', {'link': 'Corrupted Blood'}),
-
-        #
-        # Misc stats
-        #
-
-        ('Character Size', {'link': 'Character Size'}),
-
-        #
-        # Skills
-        #
-        ('Abyssal Cry', {'link': 'Abyssal Cry'}),
-        ('Ancestral Protector', {'link': 'Ancestral Protector'}),
-        ('Ancestral Warchief', {'link': 'Ancestral Warchief'}),
-        ('Anger', {'link': 'Anger'}),
-        ('Animate(?:|d) Guardian', {'link': 'Animate Guardian'}),
-        ('Animate(?:|d) Weapon', {'link': 'Animate Weapon'}),
-        ('(?:Arc | Arc)', {'link': 'Arc'}),
-        ('Arctic Armour', {'link': 'Arctic Armour'}),
-        ('Arctic Breath', {'link': 'Arctic Breath'}),
-        ('Assassin\'s Mark', {'link': 'Assassin\'s Mark'}),
-        ('Ball Lightning', {'link': 'Ball Lightning'}),
-        ('Barrage', {'link': 'Barrage'}),
-        ('Bear Trap', {'link': 'Bear Trap'}),
-        ('Blade Flurry', {'link': 'Blade Flurry'}),
-        ('Blade Trap', {'link': 'Blade Trap'}),
-        ('Blade Vortex', {'link': 'Blade Vortex'}),
-        ('Bladefall', {'link': 'Bladefall'}),
-        ('Blast Rain', {'link': 'Blast Rain'}),
-        ('Blight', {'link': 'Blight'}),
-        ('Blink Arrow', {'link': 'Blink Arrow'}),
-        ('Blood Rage', {'link': 'Blood Rage'}),
-        ('Bone Offering', {'link': 'Bone Offering'}),
-        ('Burning Arrow', {'link': 'Burning Arrow'}),
-        ('Caustic Arrow', {'link': 'Caustic Arrow'}),
-        ('Charged Dash', {'link': 'Charged Dash'}),
-        ('Clarity', {'link': 'Clarity'}),
-        ('Cleave', {'link': 'Cleave'}),
-        ('Cold Snap', {'link': 'Cold Snap'}),
-        ('Conductivity', {'link': 'Conductivity'}),
-        ('Contagion', {'link': 'Contagion'}),
-        ('Conversion Trap', {'link': 'Conversion Trap'}),
-        ('Convocation', {'link': 'Convocation'}),
-        ('Cyclone', {'link': 'Cyclone'}),
-        ('Damage Infusion', {'link': 'Damage Infusion'}),
-        ('Dark Pact', {'link': 'Dark Pact'}),
-        ('Decoy Totem', {'link': 'Decoy Totem'}),
-        ('Desecrate', {'link': 'Desecrate'}),
-        ('Determination', {'link': 'Determination'}),
-        ('Detonate Dead', {'link': 'Detonate Dead'}),
-        ('Detonate Mines', {'link': 'Detonate Mines'}),
-        ('Devouring Totem', {'link': 'Devouring Totem'}),
-        ('Discharge', {'link': 'Discharge'}),
-        ('Discipline', {'link': 'Discipline'}),
-        ('Dominating Blow', {'link': 'Dominating Blow'}),
-        ('Doom Arrow', {'link': 'Doom Arrow'}),
-        ('Double Strike', {'link': 'Double Strike'}),
-        ('Dual Strike', {'link': 'Dual Strike'}),
-        ('Earthquake', {'link': 'Earthquake'}),
-        ('Elemental Hit', {'link': 'Elemental Hit'}),
-        ('Elemental Weakness', {'link': 'Elemental Weakness'}),
-        ('Enduring Cry', {'link': 'Enduring Cry'}),
-        ('Energy Beam', {'link': 'Energy Beam'}),
-        ('Enfeeble', {'link': 'Enfeeble'}),
-        ('Essence Drain', {'link': 'Essence Drain'}),
-        ('Ethereal Knives', {'link': 'Ethereal Knives'}),
-        ('Explosive Arrow', {'link': 'Explosive Arrow'}),
-        ('Fire Nova Mine', {'link': 'Fire Nova Mine'}),
-        ('Fire Trap', {'link': 'Fire Trap'}),
-        ('Fire Weapon', {'link': 'Fire Weapon'}),
-        ('Fireball', {'link': 'Fireball'}),
-        ('Firestorm', {'link': 'Firestorm'}),
-        ('Flame Dash', {'link': 'Flame Dash'}),
-        ('Flame Surge', {'link': 'Flame Surge'}),
-        ('Flame Totem', {'link': 'Flame Totem'}),
-        ('Flameblast', {'link': 'Flameblast'}),
-        ('Flammability', {'link': 'Flammability'}),
-        ('Flesh Offering', {'link': 'Flesh Offering'}),
-        ('Flicker Strike', {'link': 'Flicker Strike'}),
-        ('Freeze Mine', {'link': 'Freeze Mine'}),
-        ('Freezing Pulse', {'link': 'Freezing Pulse'}),
-        ('Frenzy', {'link': 'Frenzy'}),
-        ('Frostbolt', {'link': 'Frostbolt'}),
-        ('Frost Blades', {'link': 'Frost Blades'}),
-        ('Frost Bomb', {'link': 'Frost Bomb'}),
-        ('Frost Wall', {'link': 'Frost Wall'}),
-        ('Frostbite', {'link': 'Frostbite'}),
-        ('Glacial Cascade', {'link': 'Glacial Cascade'}),
-        ('Glacial Hammer', {'link': 'Glacial Hammer'}),
-        ('Grace', {'link': 'Grace'}),
-        ('Ground Slam', {'link': 'Ground Slam'}),
-        ('Haste', {'link': 'Haste'}),
-        ('Hatred', {'link': 'Hatred'}),
-        ('Heavy Strike', {'link': 'Heavy Strike'}),
-        ('Herald of Ash', {'link': 'Herald of Ash'}),
-        ('Herald of Blood', {'link': 'Herald of Blood'}),
-        ('Herald of Ice', {'link': 'Herald of Ice'}),
-        ('Herald of Thunder', {'link': 'Herald of Thunder'}),
-        ('Ice Crash', {'link': 'Ice Crash'}),
-        ('Ice Nova', {'link': 'Ice Nova'}),
-        ('Ice Shot', {'link': 'Ice Shot'}),
-        ('Ice Spear', {'link': 'Ice Spear'}),
-        ('Ice Trap', {'link': 'Ice Trap'}),
-        ('Immortal Call', {'link': 'Immortal Call'}),
-        ('Incinerate', {'link': 'Incinerate'}),
-        ('Infernal Blow', {'link': 'Infernal Blow'}),
-        ('Kinetic Blast', {'link': 'Kinetic Blast'}),
-        ('Lacerate', {'link': 'Lacerate'}),
-        ('Leap Slam', {'link': 'Leap Slam'}),
-        ('Lightning Arrow', {'link': 'Lightning Arrow'}),
-        ('Lightning Channel', {'link': 'Lightning Channel'}),
-        ('Lightning Circle', {'link': 'Lightning Circle'}),
-        ('Lightning Strike', {'link': 'Lightning Strike'}),
-        ('Lightning Tendrils', {'link': 'Lightning Tendrils'}),
-        ('Lightning Trap', {'link': 'Lightning Trap'}),
-        ('Lightning Warp', {'link': 'Lightning Warp'}),
-        ('Magma Orb', {'link': 'Magma Orb'}),
-        ('Mirror Arrow', {'link': 'Mirror Arrow'}),
-        ('Molten Shell', {'link': 'Molten Shell'}),
-        ('Molten Strike', {'link': 'Molten Strike'}),
-        ('Orb of Storms', {'link': 'Orb of Storms'}),
-        ('Phase Run', {'link': 'Phase Run'}),
-        ('Poacher\'s Mark', {'link': 'Poacher\'s Mark'}),
-        ('Portal', {'link': 'Portal'}),
-        ('Power Siphon', {'link': 'Power Siphon'}),
-        ('Projectile Weakness', {'link': 'Projectile Weakness'}),
-        ('Puncture', {'link': 'Puncture'}),
-        ('Punishment', {'link': 'Punishment'}),
-        ('Purity of Elements', {'link': 'Purity of Elements'}),
-        ('Purity of Fire', {'link': 'Purity of Fire'}),
-        ('Purity of Ice', {'link': 'Purity of Ice'}),
-        ('Purity of Lightning', {'link': 'Purity of Lightning'}),
-        ('Rain of Arrows', {'link': 'Rain of Arrows'}),
-        ('Raise Spectre', {'link': 'Raise Spectre'}),
-        ('Raise Zombie', {'link': 'Raise Zombie'}),
-        ('Rallying Cry', {'link': 'Rallying Cry'}),
-        ('Reave', {'link': 'Reave'}),
-        ('Reckoning', {'link': 'Reckoning'}),
-        ('Rejuvenation Totem', {'link': 'Rejuvenation Totem'}),
-        ('Righteous Fire', {'link': 'Righteous Fire'}),
-        ('Righteous Lightning', {'link': 'Righteous Lightning'}),
-        ('Riposte', {'link': 'Riposte'}),
-        ('Scorching Ray', {'link': 'Scorching Ray'}),
-        ('Searing Bond', {'link': 'Searing Bond'}),
-        ('Shadow Blades', {'link': 'Shadow Blades'}),
-        ('Shield Charge', {'link': 'Shield Charge'}),
-        ('Shock Nova', {'link': 'Shock Nova'}),
-        ('Shockwave Totem', {'link': 'Shockwave Totem'}),
-        ('Shrapnel Shot', {'link': 'Shrapnel Shot'}),
-        ('Siege Ballista', {'link': 'Siege Ballista'}),
-        ('Smoke Mine', {'link': 'Smoke Mine'}),
-        ('Spark', {'link': 'Spark'}),
-        ('Spectral Throw', {'link': 'Spectral Throw'}),
-        ('Spirit Offering', {'link': 'Spirit Offering'}),
-        ('Split Arrow', {'link': 'Split Arrow'}),
-        ('Static Strike', {'link': 'Static Strike'}),
-        ('Static Tether', {'link': 'Static Tether'}),
-        ('Storm Burst', {'link': 'Storm Burst'}),
-        ('Storm Call', {'link': 'Storm Call'}),
-        ('(?:Summon |)Chaos Golem(?:|s)', {'link': 'Summon Chaos Golem'}),
-        ('(?:Summon |)Flame Golem(?:|s)', {'link': 'Summon Flame Golem'}),
-        ('(?:Summon |)Ice Golem(?:|s)', {'link': 'Summon Ice Golem'}),
-        ('(?:Summon |)Lightning Golem(?:|s)', {
-            'link': 'Summon Lightning Golem'
-        }),
-        ('Summon Raging Spirit', {'link': 'Summon Raging Spirit'}),
-        ('Summon Skeleton', {'link': 'Summon Skeleton'}),
-        ('(?:Summon |)Stone Golem(?:|s)', {'link': 'Summon Stone Golem'}),
-        ('Sunder', {'link': 'Sunder'}),
-        ('Sweep', {'link': 'Sweep'}),
-        ('Tempest Shield', {'link': 'Tempest Shield'}),
-        ('Temporal Chains', {'link': 'Temporal Chains'}),
-        ('Tornado Shot', {'link': 'Tornado Shot'}),
-        ('Vaal Arc', {'link': 'Vaal Arc'}),
-        ('Vaal Burning Arrow', {'link': 'Vaal Burning Arrow'}),
-        ('Vaal Clarity', {'link': 'Vaal Clarity'}),
-        ('Vaal Cold Snap', {'link': 'Vaal Cold Snap'}),
-        ('Vaal Cyclone', {'link': 'Vaal Cyclone'}),
-        ('Vaal Detonate Dead', {'link': 'Vaal Detonate Dead'}),
-        ('Vaal Discipline', {'link': 'Vaal Discipline'}),
-        ('Vaal Double Strike', {'link': 'Vaal Double Strike'}),
-        ('Vaal FireTrap', {'link': 'Vaal FireTrap'}),
-        ('Vaal Fireball', {'link': 'Vaal Fireball'}),
-        ('Vaal Flameblast', {'link': 'Vaal Flameblast'}),
-        ('Vaal Glacial Hammer', {'link': 'Vaal Glacial Hammer'}),
-        ('Vaal Grace', {'link': 'Vaal Grace'}),
-        ('Vaal Ground Slam', {'link': 'Vaal Ground Slam'}),
-        ('Vaal Haste', {'link': 'Vaal Haste'}),
-        ('Vaal Heavy Strike', {'link': 'Vaal Heavy Strike'}),
-        ('Vaal Ice Nova', {'link': 'Vaal Ice Nova'}),
-        ('Vaal Immortal Call', {'link': 'Vaal Immortal Call'}),
-        ('Vaal Lightning Strike', {'link': 'Vaal Lightning Strike'}),
-        ('Vaal Lightning Trap', {'link': 'Vaal Lightning Trap'}),
-        ('Vaal Lightning Warp', {'link': 'Vaal Lightning Warp'}),
-        ('Vaal Molten Shell', {'link': 'Vaal Molten Shell'}),
-        ('Vaal Power Siphon', {'link': 'Vaal Power Siphon'}),
-        ('Vaal Rain of Arrows', {'link': 'Vaal Rain of Arrows'}),
-        ('Vaal Reave', {'link': 'Vaal Reave'}),
-        ('Vaal Righteous Fire', {'link': 'Vaal Righteous Fire'}),
-        ('Vaal Spark', {'link': 'Vaal Spark'}),
-        ('Vaal Spectral Throw', {'link': 'Vaal Spectral Throw'}),
-        ('Vaal Storm Call', {'link': 'Vaal Storm Call'}),
-        ('Vaal Summon Skeletons', {'link': 'Vaal Summon Skeletons'}),
-        ('Vaal Sweep', {'link': 'Vaal Sweep'}),
-        ('Vengeance', {'link': 'Vengeance'}),
-        ('Vigilant Strike', {'link': 'Vigilant Strike'}),
-        ('Viper Strike', {'link': 'Viper Strike'}),
-        ('Vitality', {'link': 'Vitality'}),
-        ('Vortex', {'link': 'Vortex'}),
-        ('Vulnerability', {'link': 'Vulnerability'}),
-        ('Warlord\'s Mark', {'link': 'Warlord\'s Mark'}),
-        ('Whirling Blades', {'link': 'Whirling Blades'}),
-        ('Wild Strike', {'link': 'Wild Strike'}),
-        ('Wither', {'link': 'Wither'}),
-        ('Wrath', {'link': 'Wrath'}),
-        #
-        # Enchantment skills
-        #
-        ('Commandment of Blades', {'link': 'Commandment of Blades'}),
-        ('Commandment of Flames', {'link': 'Commandment of Flames'}),
-        ('Commandment of Force', {'link': 'Commandment of Force'}),
-        ('Commandment of Frost', {'link': 'Commandment of Frost'}),
-        ('Commandment of Fury', {'link': 'Commandment of Fury'}),
-        ('Commandment of Inferno', {'link': 'Commandment of Inferno'}),
-        ('Commandment of Ire', {'link': 'Commandment of Ire'}),
-        ('Commandment of Light', {'link': 'Commandment of Light'}),
-        ('Commandment of Reflection', {'link': 'Commandment of Reflection'}),
-        ('Commandment of Spite', {'link': 'Commandment of Spite'}),
-        ('Commandment of Thunder', {'link': 'Commandment of Thunder'}),
-        ('Commandment of War', {'link': 'Commandment of War'}),
-        ('Commandment of Winter', {'link': 'Commandment of Winter'}),
-        ('Commandment of the Grave', {'link': 'Commandment of the Grave'}),
-        ('Commandment of the Tempest', {'link': 'Commandment of the Tempest'}),
-        ('Decree of Blades', {'link': 'Decree of Blades'}),
-        ('Decree of Flames', {'link': 'Decree of Flames'}),
-        ('Decree of Force', {'link': 'Decree of Force'}),
-        ('Decree of Frost', {'link': 'Decree of Frost'}),
-        ('Decree of Fury', {'link': 'Decree of Fury'}),
-        ('Decree of Inferno', {'link': 'Decree of Inferno'}),
-        ('Decree of Ire', {'link': 'Decree of Ire'}),
-        ('Decree of Light', {'link': 'Decree of Light'}),
-        ('Decree of Reflection', {'link': 'Decree of Reflection'}),
-        ('Decree of Spite', {'link': 'Decree of Spite'}),
-        ('Decree of Thunder', {'link': 'Decree of Thunder'}),
-        ('Decree of War', {'link': 'Decree of War'}),
-        ('Decree of Winter', {'link': 'Decree of Winter'}),
-        ('Decree of the Grave', {'link': 'Decree of the Grave'}),
-        ('Decree of the Tempest', {'link': 'Decree of the Tempest'}),
-        ('Edict of Blades', {'link': 'Edict of Blades'}),
-        ('Edict of Flames', {'link': 'Edict of Flames'}),
-        ('Edict of Force', {'link': 'Edict of Force'}),
-        ('Edict of Frost', {'link': 'Edict of Frost'}),
-        ('Edict of Fury', {'link': 'Edict of Fury'}),
-        ('Edict of Inferno', {'link': 'Edict of Inferno'}),
-        ('Edict of Ire', {'link': 'Edict of Ire'}),
-        ('Edict of Light', {'link': 'Edict of Light'}),
-        ('Edict of Reflection', {'link': 'Edict of Reflection'}),
-        ('Edict of Spite', {'link': 'Edict of Spite'}),
-        ('Edict of Thunder', {'link': 'Edict of Thunder'}),
-        ('Edict of War', {'link': 'Edict of War'}),
-        ('Edict of Winter', {'link': 'Edict of Winter'}),
-        ('Edict of the Grave', {'link': 'Edict of the Grave'}),
-        ('Edict of the Tempest', {'link': 'Edict of the Tempest'}),
-        ('Word of Blades', {'link': 'Word of Blades'}),
-        ('Word of Flames', {'link': 'Word of Flames'}),
-        ('Word of Force', {'link': 'Word of Force'}),
-        ('Word of Frost', {'link': 'Word of Frost'}),
-        ('Word of Fury', {'link': 'Word of Fury'}),
-        ('Word of Inferno', {'link': 'Word of Inferno'}),
-        ('Word of Ire', {'link': 'Word of Ire'}),
-        ('Word of Light', {'link': 'Word of Light'}),
-        ('Word of Reflection', {'link': 'Word of Reflection'}),
-        ('Word of Spite', {'link': 'Word of Spite'}),
-        ('Word of Thunder', {'link': 'Word of Thunder'}),
-        ('Word of War', {'link': 'Word of War'}),
-        ('Word of Winter', {'link': 'Word of Winter'}),
-        ('Word of the Grave', {'link': 'Word of the Grave'}),
-        ('Word of the Tempest', {'link': 'Word of the Tempest'}),
-        #
-        # Support gems
-        #
-        ('(?:level [0-9]+) Added Chaos Damage', {
-            'link': 'Added Chaos Damage Support'}),
-        ('(?:level [0-9]+) Added Cold Damage', {
-            'link': 'Added Cold Damage Support'}),
-        ('(?:level [0-9]+) Added Fire Damage', {
-            'link': 'Added Fire Damage Support'}),
-        ('(?:level [0-9]+) Added Lightning Damage', {
-            'link': 'Added Lightning Damage Support'}),
-        ('(?:level [0-9]+) Additional Accuracy', {
-            'link': 'Additional Accuracy Support'}),
-        ('(?:level [0-9]+) Arcane Surge', {'link': 'Arcane Surge Support'}),
-        ('(?:level [0-9]+) Blasphemy', {'link': 'Blasphemy Support'}),
-        ('(?:level [0-9]+) Blind', {'link': 'Blind Support'}),
-        ('(?:level [0-9]+) Block Chance Reduction', {
-            'link': 'Block Chance Reduction Support'}),
-        ('(?:level [0-9]+) Blood Magic', {'link': 'Blood Magic Support'}),
-        ('(?:level [0-9]+) Bloodlust', {'link': 'Bloodlust Support'}),
-        ('(?:level [0-9]+) Brutality', {'link': 'Brutality Support'}),
-        ('(?:level [0-9]+) Burning Damage', {'link': 'Burning Damage Support'}),
-        ('(?:level [0-9]+) Cast On Critical Strike', {
-            'link': 'Cast On Critical Strike Support'}),
-        ('(?:level [0-9]+) Cast on Death', {'link': 'Cast on Death Support'}),
-        ('(?:level [0-9]+) Cast on Melee Kill', {
-            'link': 'Cast on Melee Kill Support'}),
-        ('(?:level [0-9]+) Cast when Damage Taken', {
-            'link': 'Cast when Damage Taken Support'}),
-        ('(?:level [0-9]+) Cast when Stunned', {
-            'link': 'Cast when Stunned Support'}),
-        ('(?:level [0-9]+) Chain', {'link': 'Chain Support'}),
-        ('(?:level [0-9]+) Chance to Bleed', {
-            'link': 'Chance to Bleed Support'}),
-        ('(?:level [0-9]+) Chance to Flee', {'link': 'Chance to Flee Support'}),
-        ('(?:level [0-9]+) Chance to Ignite', {
-            'link': 'Chance to Ignite Support'}),
-        ('(?:level [0-9]+) Cluster Traps', {'link': 'Cluster Traps Support'}),
-        ('(?:level [0-9]+) Cold Penetration', {
-            'link': 'Cold Penetration Support'}),
-        ('(?:level [0-9]+) Cold to Fire', {'link': 'Cold to Fire Support'}),
-        ('(?:level [0-9]+) Concentrated Effect', {
-            'link': 'Concentrated Effect Support'}),
-        ('(?:level [0-9]+) Controlled Destruction', {
-            'link': 'Controlled Destruction Support'}),
-        ('(?:level [0-9]+) Culling Strike', {'link': 'Culling Strike Support'}),
-        ('(?:level [0-9]+) Curse On Hit', {'link': 'Curse On Hit Support'}),
-        ('(?:level [0-9]+) Damage on Full Life', {
-            'link': 'Damage on Full Life Support'}),
-        ('(?:level [0-9]+) Deadly Ailments', {
-            'link': 'Deadly Ailments Support'}),
-        ('(?:level [0-9]+) Decay', {'link': 'Decay Support'}),
-        ('(?:level [0-9]+) Efficacy', {'link': 'Efficacy Support'}),
-        ('(?:level [0-9]+) Elemental Focus', {
-            'link': 'Elemental Focus Support'}),
-        ('(?:level [0-9]+) Elemental Proliferation', {
-            'link': 'Elemental Proliferation Support'}),
-        ('(?:level [0-9]+) Empower', {'link': 'Empower Support'}),
-        ('(?:level [0-9]+) Endurance Charge on Melee Stun', {
-            'link': 'Endurance Charge on Melee Stun Support'}),
-        ('(?:level [0-9]+) Enhance', {'link': 'Enhance Support'}),
-        ('(?:level [0-9]+) Enlighten', {'link': 'Enlighten Support'}),
-        ('(?:level [0-9]+) Elemental Damage with Attacks', {
-            'link': 'Elemental Damage with Attacks Support'}),
-        ('(?:level [0-9]+) Faster Attacks', {
-            'link': 'Faster Attacks Support'}),
-        ('(?:level [0-9]+) Faster Casting', {
-            'link': 'Faster Casting Support'}),
-        ('(?:level [0-9]+) Faster Projectiles', {
-            'link': 'Faster Projectiles Support'}),
-        ('(?:level [0-9]+) Fire Penetration', {
-            'link': 'Fire Penetration Support'}),
-        ('(?:level [0-9]+) Fork', {'link': 'Fork Support'}),
-        ('(?:level [0-9]+) Fortify', {'link': 'Fortify Support'}),
-        ('(?:level [0-9]+) Generosity', {'link': 'Generosity Support'}),
-        ('(?:level [0-9]+) Greater Multiple Projectiles', {
-            'link': 'Greater Multiple Projectiles Support'}),
-        ('(?:level [0-9]+) Hypothermia', {'link': 'Hypothermia Support'}),
-        ('(?:level [0-9]+) Ice Bite', {'link': 'Ice Bite Support'}),
-        ('(?:level [0-9]+) Increased Area of Effect', {
-            'link': 'Increased Area of Effect Support'}),
-        ('(?:level [0-9]+) Increased Critical Damage', {
-            'link': 'Increased Critical Damage Support'}),
-        ('(?:level [0-9]+) Increased Critical Strikes', {
-            'link': 'Increased Critical Strikes Support'}),
-        ('(?:level [0-9]+) Increased Duration', {
-            'link': 'Increased Duration Support'}),
-        ('(?:level [0-9]+) Innervate', {'link': 'Innervate Support'}),
-        ('(?:level [0-9]+) Ignite Proliferation', {
-            'link': 'Ignite Proliferation Support'}),
-        ('(?:level [0-9]+) Iron Grip', {'link': 'Iron Grip Support'}),
-        ('(?:level [0-9]+) Iron Will', {'link': 'Iron Will Support'}),
-        ('(?:level [0-9]+) Item Quantity', {'link': 'Item Quantity Support'}),
-        ('(?:level [0-9]+) Item Rarity', {'link': 'Item Rarity Support'}),
-        ('(?:level [0-9]+) Immolate', {'link': 'Immolate Support'}),
-        ('(?:level [0-9]+) Knockback', {'link': 'Knockback Support'}),
-        ('(?:level [0-9]+) Less Duration', {'link': 'Less Duration Support'}),
-        ('(?:level [0-9]+) Lesser Multiple Projectiles', {
-            'link': 'Lesser Multiple Projectiles Support'}),
-        ('(?:level [0-9]+) Lesser Poison', {'link': 'Lesser Poison Support'}),
-        ('(?:level [0-9]+) Life Gain on Hit', {
-            'link': 'Life Gain on Hit Support'}),
-        ('(?:level [0-9]+) Life Leech', {'link': 'Life Leech Support'}),
-        ('(?:level [0-9]+) Lightning Penetration', {
-            'link': 'Lightning Penetration Support'}),
-        ('(?:level [0-9]+) Maim', {'link': 'Maim Support'}),
-        ('(?:level [0-9]+) Mana Leech', {'link': 'Mana Leech Support'}),
-        ('(?:level [0-9]+) Melee Physical Damage', {
-            'link': 'Melee Physical Damage Support'}),
-        ('(?:level [0-9]+) Melee Splash', {'link': 'Melee Splash Support'}),
-        ('(?:level [0-9]+) Minefield', {'link': 'Minefield Support'}),
-        ('(?:level [0-9]+) Minion Damage', {'link': 'Minion Damage Support'}),
-        ('(?:level [0-9]+) Minion Life', {'link': 'Minion Life Support'}),
-        ('(?:level [0-9]+) Minion Speed', {'link': 'Minion Speed Support'}),
-        ('(?:level [0-9]+) Minion and Totem Elemental Resistance', {
-            'link': 'Minion and Totem Elemental Resistance Support'}),
-        ('(?:level [0-9]+) Multiple Traps', {'link': 'Multiple Traps Support'}),
-        ('(?:level [0-9]+) Multistrike', {'link': 'Multistrike Support'}),
-        ('(?:level [0-9]+) Onslaught', {'link': 'Onslaught Support'}),
-        ('(?:level [0-9]+) Physical Projectile Attack Damage', {
-            'link': 'Physical Projectile Attack Damage Support'}),
-        ('(?:level [0-9]+) Physical to Lightning', {
-            'link': 'Physical to Lightning Support'}),
-        ('(?:level [0-9]+) Pierce', {'link': 'Pierce Support'}),
-        ('(?:level [0-9]+) Point Blank', {'link': 'Point Blank Support'}),
-        ('(?:level [0-9]+) Poison', {'link': 'Poison Support'}),
-        ('(?:level [0-9]+) Power Charge On Critical', {
-            'link': 'Power Charge On Critical Support'}),
-        ('(?:level [0-9]+) Ranged Attack Totem', {
-            'link': 'Ranged Attack Totem Support'}),
-        ('(?:level [0-9]+) Reduced Mana', {'link': 'Reduced Mana Support'}),
-        ('(?:level [0-9]+) Remote Mine', {'link': 'Remote Mine Support'}),
-        ('(?:level [0-9]+) Return Projectiles', {
-            'link': 'Return Projectiles Support'}),
-        ('(?:level [0-9]+) Ruthless', {'link': 'Ruthless Support'}),
-        ('(?:level [0-9]+) Slower Projectiles', {
-            'link': 'Slower Projectiles Support'}),
-        ('(?:level [0-9]+) Spell Echo', {'link': 'Spell Echo Support'}),
-        ('(?:level [0-9]+) Spell Totem', {'link': 'Spell Totem Support'}),
-        ('(?:level [0-9]+) Split Projectiles', {
-            'link': 'Split Projectiles Support'}),
-        ('(?:level [0-9]+) Stun', {'link': 'Stun Support'}),
-        ('(?:level [0-9]+) Swift Affliction', {
-            'link': 'Swift Affliction Support'}),
-        ('(?:level [0-9]+) Trap', {'link': 'Trap Support'}),
-        ('(?:level [0-9]+) Trap Cooldown', {'link': 'Trap Cooldown Support'}),
-        ('(?:level [0-9]+) Trap and Mine Damage', {
-            'link': 'Trap and Mine Damage Support'}),
-        ('(?:level [0-9]+) Unbound Ailments', {
-            'link': 'Unbound Ailments Support'}),
-        ('(?:level [0-9]+) Vile Toxins', {'link': 'Vile Toxins Support'}),
-        ('(?:level [0-9]+) Void Manipulation', {
-            'link': 'Void Manipulation Support'}),
-        #
-        # Groups
-        #
-        ('Physical(?:Skill|Gem)', {'link': 'Physical Skills'}),
-        ('Fire (?:Skill|Gem)', {'link': 'Fire Skills'}),
-        ('Cold (?:Skill|Gem)', {'link': 'Cold Skills'}),
-        ('Lightning (?:Skill|Gem)', {'link': 'Lightning Skills'}),
-        ('Chaos (?:Skill|Gem)', {'link': 'Chaos Skills'}),
-        ('Area (?:Skill|Gem)', {'link': 'Area Skills'}),
-        ('Melee (?:Skill|Gem)', {'link': 'Melee Skills'}),
-        ('Bow (?:Skill|Gem)', {'link': 'Bow Skills'}),
-        ('Minion (?:Skill|Gem)', {'link': 'Minion Skills'}),
-
-        #
-        # Damage
-        #
-        # Base types
-        ('Chaos Damage', {'link': 'Chaos Damage'}),
-        ('Cold Damage', {'link': 'Cold Damage'}),
-        ('Fire Damage', {'link': 'Fire Damage'}),
-        ('Lightning Damage', {'link': 'Lightning Damage'}),
-        ('Physical Damage', {'link': 'Physical Damage'}),
-        # Mixed and special
-        ('Attack Damage', {'link': 'Attack Damage'}),
-        ('Spell Damage', {'link': 'Spell Damage'}),
-        ('Elemental Damage', {'link': 'Elemental Damage'}),
-        ('Minion Damage', {'link': 'Minion Damage'}),
-
-        #
-        # Armour & weapon types
-        #
-
-        # Generic
-        ('Two Handed Melee Weapon(?:|s)', {'link': 'Two Handed Melee Weapons'}),
-
-        # Armour
-        ('Shield(?:|s)', {'link': 'Shield'}),
-
-        # Melee
-        ('Axe(?:|s)', {'link': 'Axe'}),
-        ('Claw(?:|s)', {'link': 'Claw'}),
-        ('Dagger(?:|s)', {'link': 'Dagger'}),
-        ('Mace(?:|s)', {'link': 'Mace'}),
-        ('Staff|Staves', {'link': 'Staff'}),
-        ('Sword(?:|s)', {'link': 'Sword'}),
-
-        # Range
-        ('Bow(?:|s)', {'link': 'Bow'}),
-        ('Wand(?:|s)', {'link': 'Axe'}),
-        #
-        # Status
-        #
-
-        ('Shock(?:|s|ed)', {'link': 'Shock'}),
-        ('Ignite(?:|s|ed)', {'link': 'Ignite'}),
-        ('Frozen|Freeze(?:|s)', {'link': 'Freeze'}),
-        ('Poison(?:|s|ed)', {'link': 'Poison'}),
-
-        #
-        # Misc
-        #
-        ('Curse(?:|s|ed)', {'link': 'Curse'}),
-        ('Socket(?:|s|ed)', {'link': 'Item socket'}),
-        ('Recently', {'link': 'Recently'}),
-        ('Skill(?:|s)', {'link': 'Skill'}),
-        ('Spell(?:|s)', {'link': 'Spell'}),
-        ('Attack(?:|s)', {'link': 'Attack'}),
-        ('Minion(?:|s)', {'link': 'Minion'}),
-        ('Mine(?:|s)', {'link': 'Mine'}),
-        ('Totem(?:|s)', {'link': 'Totem'}),
-        ('Trap(?:|s)', {'link': 'Trap'}),
-        ('Dual Wield(?:|ing)', {'link': 'Dual Wield'}),
-        ('Level', {'link': 'Level'}),
-        ('PvP', {'link': 'PvP'}),
-        ('Hit(?:|s)', {'link': 'Hit'}),
-        ('Kill(?:|s)', {'link': 'Kill'}),
-        ('Charge(?:|s)', {'link': 'Charge'}),
-        ('Lucky', {'link': 'Lucky'}),
-        ('Unlucky', {'link': 'Unlucky'}),
-    ),
-}
-
-'''_inter_wiki_re = re.compile(
-    r'(?: |^)(?P<text>%s))' % '|'.join([item[0] for item in _inter_wiki_map]),
-    re.UNICODE | re.IGNORECASE
-)'''
-
-_MAX_RE = 97
-
-
-def _make_inter_wiki_re():
-    out = {}
-    for language, _inter_wiki_mapping in _inter_wiki_map.items():
-        out[language] = []
-        for i in range(0, (len(_inter_wiki_mapping)//_MAX_RE)+1):
-            id = i*_MAX_RE
-            out[language].append(re.compile(
-                r'(?![^\[]*\]\])'
-                r'(?: |^)'
-                r'(?P<text>%s)'
-                r'(?= |$)' %
-                '|'.join(['(%s)' % item[0] for item in _inter_wiki_mapping[id:id+_MAX_RE]]),
-                re.UNICODE | re.IGNORECASE,
-            ))
-    return out
+_INTER_WIKI_MAP_FILE = os.path.join(DATA_DIR, 'inter_wiki_map.tsv')
+
+
+@lru_cache(maxsize=None)
+def _get_inter_wiki_map():
+    """
+    Reads the inter wiki map from the data directory.
+
+    Each non comment line holds the language, the pattern and the link target
+    separated by tabs; the order of the lines is kept as it determines the
+    priority of the entries.
+
+    Returns
+    -------
+    dict[str, tuple[tuple[str, str]]]
+        (pattern, link) pairs per language
+    """
+    inter_wiki_map = {}
+    with open(_INTER_WIKI_MAP_FILE, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
+            if not row or row[0].startswith('#'):
+                continue
+            language, pattern, link = row
+            inter_wiki_map.setdefault(language, []).append((pattern, link))
+
+    return {language: tuple(entries)
+            for language, entries in inter_wiki_map.items()}
+
+
+# Characters that mark an inter wiki map entry as an actual regular expression
+# rather than a plain literal
+_inter_wiki_regex_chars = re.compile(r'[\\.^$*+?{}\[\]|()]', re.UNICODE)
+_inter_wiki_group_re = re.compile(r'\(\?:([^()]*)\)', re.UNICODE)
+# Prefix shared by the support gem entries, i.e. "level 12 Poison"
+_INTER_WIKI_GEM_PREFIX = '(?:level [0-9]+) '
+
+
+def _expand_inter_wiki_pattern(pattern):
+    """
+    Expands an inter wiki pattern into the literal strings it matches.
+
+    Only alternations of literals, either on the top level or inside
+    non-capturing groups, are supported.
+
+    Parameters
+    ----------
+    pattern : str
+        inter wiki pattern to expand
+
+    Returns
+    -------
+    list[str] or None
+        list of literal variants in order of appearance or None if the pattern
+        contains anything else
+    """
+    branches = ['']
+    depth = 0
+    for char in pattern:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == '|' and depth == 0:
+            branches.append('')
+        else:
+            branches[-1] += char
+
+    variants = []
+    for branch in branches:
+        choices = []
+        for i, part in enumerate(_inter_wiki_group_re.split(branch)):
+            # Odd parts are the contents of the groups
+            alternatives = part.split('|') if i % 2 else [part]
+            for alternative in alternatives:
+                if _inter_wiki_regex_chars.search(alternative):
+                    return None
+            choices.append(alternatives)
+
+        for combination in itertools.product(*choices):
+            variant = ''.join(combination)
+            if variant not in variants:
+                variants.append(variant)
+
+    return variants
+
+
+def _make_trie_pattern(strings):
+    """
+    Builds a regular expression matching any of the given strings from a trie
+    so common prefixes only have to be matched once.
+
+    Longer strings are always tried before their prefixes, regardless of the
+    order they are given in.
+    """
+    trie = {}
+    for string in strings:
+        node = trie
+        for char in string:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def walk(node):
+        branches = [
+            re.escape(char) + walk(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ''
+        elif len(branches) == 1 and '' not in node:
+            return branches[0]
+
+        pattern = '(?:%s)' % '|'.join(branches)
+        if '' in node:
+            pattern += '?'
+        return pattern
+
+    return walk(trie)
+
+
+@lru_cache(maxsize=None)
+def _get_inter_wiki_re(language):
+    """
+    Builds a single regular expression for the given language covering all
+    entries of the inter wiki map alongside the tables required to figure out
+    which entry produced a match.
+
+    This is done on first use, so commands that never format inter wiki links
+    don't pay for compiling the expression.
+
+    Link targets are stored in a separate tuple aligned with the map, so
+    resolving a match only requires indexing it.
+
+    Entries that can be expanded into literals are merged into a trie, which
+    tries the longest literal first no matter where the entries are listed in
+    the map. Support gem entries are handled the same way, with the trie of gem names
+    placed behind their common level prefix. Remaining regular expression
+    entries are tried before either of those.
+
+    Matches follow the precedence described in
+    :func:`make_inter_wiki_links`. The matched text is resolved to the first
+    entry of the map that matches it in full; literals and gem names are
+    looked up directly, only the regular expression entries need to be tried
+    one by one.
+
+    Everything is stored in lower case and matched against the lower cased
+    input, which is cheaper than matching case insensitively.
+
+    Parameters
+    ----------
+    language : str
+        language to build the expression for
+
+    Returns
+    -------
+    tuple or None
+        compiled expression, literal and gem name lookup tables, regular
+        expression entries, link targets and whether all terms contain letters
+        or None if there is no inter wiki map for the language
+    """
+    _inter_wiki_mapping = _get_inter_wiki_map().get(language)
+    if _inter_wiki_mapping is None:
+        return None
+
+    literals = {}
+    gems = {}
+    fallbacks = []
+    links = tuple(sys.intern(link) for pattern, link in _inter_wiki_mapping)
+    for index, item in enumerate(_inter_wiki_mapping):
+        pattern = item[0]
+        if pattern.startswith(_INTER_WIKI_GEM_PREFIX):
+            variants = _expand_inter_wiki_pattern(
+                pattern[len(_INTER_WIKI_GEM_PREFIX):]
+            )
+            table = gems
+        else:
+            variants = _expand_inter_wiki_pattern(pattern)
+            table = literals
+
+        if variants is None:
+            fallbacks.append((index, re.compile(pattern.lower(), re.UNICODE)))
+        else:
+            for variant in variants:
+                table.setdefault(variant.lower(), index)
+
+    alternatives = ['(?:%s)' % regex.pattern for i, regex in fallbacks]
+    if gems:
+        alternatives.append(
+            '%s(?P<gem>%s)' % (
+                _INTER_WIKI_GEM_PREFIX, _make_trie_pattern(gems)
+            )
+        )
+    alternatives.append(_make_trie_pattern(literals))
+
+    regex = re.compile(
+        r'(?: |^)'
+        r'(?P<text>%s)'
+        r'(?= |$)' % '|'.join(alternatives),
+        re.UNICODE,
+    )
+
+    # Whether every term contains a letter, in which case texts without any
+    # can't contain links and don't need to be searched
+    cased = not fallbacks and all(text.islower() for text in literals)
+
+    return regex, literals, gems, tuple(fallbacks), links, cased
+
+
+def _get_inter_wiki_link_spans(string):
+    """
+    Finds the position ranges that lie within existing wiki links, i.e. all
+    positions from which ']]' can be reached without passing a '['.
+
+    Parameters
+    ----------
+    string : str
+        String to search
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        list of inclusive (start, end) ranges in ascending order
+    """
+    spans = []
+    end = string.find(']]')
+    while end != -1:
+        spans.append((string.rfind('[', 0, end) + 1, end))
+        end = string.find(']]', end + 1)
+    return spans
+
+
+def _get_inter_wiki_index(match, literals, gems, fallbacks):
+    text = match.group('text')
+    gem = match.group('gem') if gems else None
+    if gem is None:
+        index = literals.get(text)
+    else:
+        index = gems[gem]
+    for i, regex in fallbacks:
+        if index is not None and i > index:
+            break
+        if regex.fullmatch(text):
+            return i
+    return index
+
+
+def _make_tag_handler(handler, tid):
+    """
+    Creates a tag handler that passes the given tid on to handler.
+
+    Parameters
+    ----------
+    handler : callable
+        handler accepting the tid as last argument
+    tid : str
+        tid to pass on
+
+    Returns
+    -------
+    callable
+        tag handler
+    """
+    def tag_handler(self, hstr, parameter):
+        return handler(self, hstr, parameter, tid)
+
+    return tag_handler
+
+
+def _read_ahead(paths):
+    """
+    Advises the operating system to start reading the given files into its
+    cache in the background.
+
+    Files that can't be opened are skipped; does nothing on platforms without
+    posix_fadvise.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        paths of the files to read ahead
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
-_inter_wiki_re = _make_inter_wiki_re()
 
 # =============================================================================
 # Classes
@@ -724,12 +419,31 @@ class BaseParser(object):
     _translations = []
 
     def __init__(self, base_path, parsed_args):
+        # Only needed once parsing actually happens; avoids loading them for
+        # unrelated commands
+        from PyPoE.poe.file.translations import (
+            TranslationFileCache,
+            install_data_dependant_quantifiers,
+        )
+
         self.parsed_args = parsed_args
         # Make sure to load the appropriate version of the specification
         set_default_spec(version=config.get_option('version'))
 
         self.base_path = base_path
 
+        # Files are read one after another below; let the OS fetch the ones
+        # further down the list while the first are being parsed
+        language = config.get_option('language')
+        data_path = os.path.join(base_path, 'Data')
+        if language != 'English':
+            data_path = os.path.join(data_path, language)
+        _read_ahead(itertools.chain(
+            (os.path.join(data_path, file_name) for file_name in self._files),
+            (os.path.join(base_path, 'Metadata', 'StatDescriptions', file_name)
+             for file_name in self._translations),
+        ))
+
         opt = {
             'use_dat_value': False,
             'auto_build_index': True,
@@ -742,40 +456,68 @@ class BaseParser(object):
             files=self._files,
             read_options=opt,
             raise_error_on_missing_relation=False,
-            language=config.get_option('language'),
+            language=language,
         )
         install_data_dependant_quantifiers(self.rr)
         self.tc = TranslationFileCache(path_or_ggpk=base_path)
         for file_name in self._translations:
             self.tc[file_name]
 
-        self.ot = OTFileCache(path_or_ggpk=base_path)
-
-        self.custom = get_custom_translation_file()
+        # Only a few parsers need these, so they're loaded on first access
+        self._ot = None
+        self._custom = None
 
         self.ggpk = None
         self._img_path = None
         self.lang = config.get_option('language')
 
+    @property
+    def ot(self):
+        """
+        Returns
+        -------
+        OTFileCache
+        """
+        if self._ot is None:
+            self._ot = OTFileCache(path_or_ggpk=self.base_path)
+
+        return self._ot
+
+    @property
+    def custom(self):
+        """
+        Returns
+        -------
+        TranslationFile
+        """
+        if self._custom is None:
+            from PyPoE.poe.file.translations import \
+                get_custom_translation_file
+            self._custom = get_custom_translation_file()
+
+        return self._custom
+
     def _column_index_filter(self, dat_file_name, column_id, arg_list,
                              error_msg=_MISSING_MSG):
-        self.rr[dat_file_name].build_index(column_id)
+        dat_file = self.rr[dat_file_name]
+        dat_file.build_index(column_id)
+        index = dat_file.index[column_id]
 
         rows = []
         missing = []
 
-        if column_id in self.rr[dat_file_name].columns_unique:
+        if column_id in dat_file.columns_unique:
             func = rows.append
         else:
             func = rows.extend
 
         for argument in arg_list:
-            if argument in self.rr[dat_file_name].index[column_id]:
-                func(
-                    self.rr[dat_file_name].index[column_id][argument]
-                )
-            else:
+            # .get doesn't add missing keys to defaultdict based indexes
+            result = index.get(argument)
+            if result is None:
                 missing.append(argument)
+            else:
+                func(result)
 
         if missing:
             console(
@@ -846,6 +588,7 @@ class BaseParser(object):
                     'is not set'
                 )
             else:
+                from PyPoE.poe.sim.mods import get_translation_file_from_domain
                 translation_file = get_translation_file_from_domain(
                     mod['Domain'])
         if stats is None or values is None:
@@ -882,41 +625,65 @@ class BaseParser(object):
             temp_ids = []
             temp_trans = []
 
+            # Positions of the translations and missing ids by their ids, so
+            # they don't have to be searched for for every default translation
+            found = {}
+            for j, tr2 in enumerate(result.found):
+                found.setdefault(tuple(tr2.ids), []).append(j)
+            missing = {}
+            for j, tid in enumerate(result.missing_ids):
+                missing.setdefault(tid, []).append(j)
+            deleted = set()
+
             for i, tr in enumerate(default.found):
-                for j, tr2 in enumerate(result.found):
-                    if tr.ids != tr2.ids:
-                        continue
+                matches = found.get(tuple(tr.ids), ())
 
-                    r1 = tr.get_language(self.lang).get_string(default.values[i])
-                    r2 = tr2.get_language(self.lang).get_string(result.values[j])
+                is_missing = False
+                for tid in tr.ids:
+                    if tid in missing:
+                        is_missing = True
+                        break
+
+                if not matches and not is_missing:
+                    continue
+
+                # Same for every match, so only get it once
+                r1 = tr.get_language(self.lang).get_string(default.values[i])
+
+                for j in matches:
+                    r2 = result.found[j].get_language(self.lang).get_string(
+                        result.values[j]
+                    )
                     if r1 and r2 and r1[0] != r2[0]:
                         temp_trans.append(self._format_detailed(r1[0], r2[0]))
                     elif r2 and r2[0]:
                         temp_trans.append(self._format_hidden(r2[0]))
                     temp_ids.append(tr.ids)
 
-                is_missing = False
-                for tid in tr.ids:
-                    if tid in result.missing_ids:
-                        is_missing = True
-                        break
-
                 if not is_missing:
                     continue
 
-                r1 = tr.get_language(self.lang).\
-                    get_string(default.values[i])
                 if r1 and r1[0]:
                     temp_trans.append(self._format_hidden(r1[0]))
                     temp_ids.append(tr.ids)
 
                 for tid in tr.ids:
-                    try:
-                        i = result.missing_ids.index(tid)
-                    except ValueError:
+                    positions = missing.get(tid)
+                    if positions is None:
                         continue
-                    del result.missing_ids[i]
-                    del result.missing_values[i]
+                    deleted.add(positions.pop(0))
+                    if not positions:
+                        del missing[tid]
+
+            if deleted:
+                result.missing_ids[:] = [
+                    tid for j, tid in enumerate(result.missing_ids)
+                    if j not in deleted
+                ]
+                result.missing_values[:] = [
+                    value for j, value in enumerate(result.missing_values)
+                    if j not in deleted
+                ]
 
             index = 0
             for i, tr in enumerate(result.found):
@@ -944,6 +711,8 @@ class BaseParser(object):
             )
 
             if custom_result.missing_ids:
+                from PyPoE.poe.file.translations import \
+                    MissingIdentifierWarning
                 warnings.warn(
                     'Missing translation for ids %s and values %s' % (
                         custom_result.missing_ids, custom_result.missing_values),
@@ -954,16 +723,9 @@ class BaseParser(object):
                 if line:
                     out.append(self._HIDDEN_FORMAT[self.lang] % line)
 
-        finalout = []
-        for line in out:
-            if '\n' in line:
-                # By request differentiate between breaks from the source file
-                # and different stats
-                finalout.append('<br />'.join(line.split('\n')))
-            else:
-                finalout.append(line)
-
-        return finalout
+        # By request differentiate between breaks from the source file and
+        # different stats
+        return [line.replace('\n', '<br />') for line in out]
 
 
 class TagHandler(object):
@@ -991,13 +753,19 @@ class TagHandler(object):
         self.rr = rr
         self.rr['BaseItemTypes.dat'].build_index('Name')
         self.rr['Words.dat'].build_index('Text')
+        # Looked up for almost every tag
+        self._item_names = self.rr['BaseItemTypes.dat'].index['Name']
+        self._words = self.rr['Words.dat'].index['Text']
 
-        self.tag_handlers = {}
-        for key, func in TagHandler.tag_handlers.items():
-            self.tag_handlers[key] = partial(func, self)
+        self.tag_handlers = {
+            key: MethodType(func, self)
+            for key, func in TagHandler.tag_handlers.items()
+        }
 
     def _check_link(self, string):
-        items = self.rr['BaseItemTypes.dat'].index['Name'][string]
+        # .get, as the index is a defaultdict that would otherwise keep an
+        # empty entry for every text that was checked
+        items = self._item_names.get(string)
         if items:
             if items[0]['ItemClassesKey']['Name'] == 'Maps':
                 string = self._IL_FORMAT % string
@@ -1014,11 +782,10 @@ class TagHandler(object):
         return self._C_FORMAT % (tid, '[[%s]]' % hstr)
 
     def _unique_handler(self, hstr, parameter):
-        words = self.rr['Words.dat'].index['Text'][hstr]
+        words = self._words.get(hstr)
         if words and words[0]['WordlistsKey'] == WORDLISTS.UNIQUE_ITEM:
             # Check whether unique item name clashes with base item name
-            items = self.rr['BaseItemTypes.dat'].index['Name'][hstr]
-            if len(items) > 0:
+            if self._item_names.get(hstr):
                 hstr = '[[%s]]' % hstr
             else:
                 hstr = self._IL_FORMAT % hstr
@@ -1027,10 +794,10 @@ class TagHandler(object):
         return self._C_FORMAT % ('unique', hstr)
 
     def _currency_handler(self, hstr, parameter):
-        if 'x ' in hstr:
-            s = hstr.split('x ', maxsplit=1)
+        amount, separator, name = hstr.partition('x ')
+        if separator:
             return self._C_FORMAT % (
-                'currency', '%sx %s' % (s[0], self._check_link(s[1]))
+                'currency', '%sx %s' % (amount, self._check_link(name))
             )
         else:
             return self._default_handler(hstr, parameter, 'currency')
@@ -1039,25 +806,25 @@ class TagHandler(object):
         return hstr
 
     tag_handlers = {
-        'normal': partial(_default_handler, tid='normal'),
-        'default': partial(_default_handler, tid='default'),
-        'augmented': partial(_default_handler, tid='augmented'),
+        'normal': _make_tag_handler(_default_handler, 'normal'),
+        'default': _make_tag_handler(_default_handler, 'default'),
+        'augmented': _make_tag_handler(_default_handler, 'augmented'),
 
         'size': _pass_through_handler,
         'smaller': _pass_through_handler,
 
-        'gemitem': partial(_default_handler, tid='gem'),
+        'gemitem': _make_tag_handler(_default_handler, 'gem'),
         'currencyitem': _currency_handler,
 
-        'whiteitem': partial(_default_handler, tid='white'),
-        'magicitem': partial(_default_handler, tid='magic'),
-        'rareitem': partial(_default_handler, tid='rare'),
+        'whiteitem': _make_tag_handler(_default_handler, 'white'),
+        'magicitem': _make_tag_handler(_default_handler, 'magic'),
+        'rareitem': _make_tag_handler(_default_handler, 'rare'),
         'uniqueitem': _unique_handler,
 
-        'divination': partial(_default_handler, tid='divination'),
-        'prophecy': partial(_default_handler, tid='prophecy'),
+        'divination': _make_tag_handler(_default_handler, 'divination'),
+        'prophecy': _make_tag_handler(_default_handler, 'prophecy'),
 
-        'corrupted': partial(_link_handler, tid='corrupted'),
+        'corrupted': _make_tag_handler(_link_handler, 'corrupted'),
     }
 
 
@@ -1153,16 +920,18 @@ def format_result_rows(parsed_args, ordered_dict, template_name,
     """
     if parsed_args.format == 'template':
         out = ['{{%s\n' % template_name]
-        for k, v in ordered_dict.items():
-            if v is not None:
-                out.append(('|{0: <%s}= {1}\n' % indent).format(k, v))
+        out.extend([
+            '|%-*s= %s\n' % (indent, k, v)
+            for k, v in ordered_dict.items() if v is not None
+        ])
         out.append('}}')
     elif parsed_args.format == 'module':
         ordered_dict['debug_id'] = 1
         out = ['{']
-        for k, v in ordered_dict.items():
-            if v is not None:
-                out.append('{0} = "{1}", '.format(k, v))
+        out.extend([
+            '%s = "%s", ' % (k, v)
+            for k, v in ordered_dict.items() if v is not None
+        ])
         out[-1] = out[-1].strip(', ')
         out.append('}')
     return ''.join(out)
@@ -1173,6 +942,18 @@ def make_inter_wiki_links(string):
     Formats the given string according to the predefined inter wiki formatting
     rules and returns it.
 
+    Links are placed on whole, space separated words from left to right and
+    never overlap, so a match that starts further left always wins. Of the
+    matches starting at the same word, regular expression entries of the map
+    are tried first, then support gems ('level N' followed by the gem name)
+    and then all other terms; of the gem names and of the terms the longest
+    one wins. For example 'vaal arc' links to Vaal Arc rather than Arc and
+    'level 16 Mana Leech' links to Mana Leech Support rather than Level, Mana
+    and Leech.
+
+    Results are cached per language, since the same stat texts tend to be
+    formatted many times over during an export.
+
     Parameters
     ----------
     string : str
@@ -1183,35 +964,61 @@ def make_inter_wiki_links(string):
     str
         String formatted with inter wiki links
     """
+    return _make_inter_wiki_links(string, config.get_option('language'))
 
-    _inter_wiki = _inter_wiki_re.get(config.get_option('language'))
+
+@lru_cache(maxsize=2**16)
+def _make_inter_wiki_links(string, language):
+    _inter_wiki = _get_inter_wiki_re(language)
 
     if _inter_wiki is None:
         return string
 
-    mapping = _inter_wiki_map.get(config.get_option('language'))
+    regex, literals, gems, fallbacks, links, cased = _inter_wiki
+    lowered = string.lower()
+    # Lower cased text only fails this if it has no letters at all, e.g. for
+    # plain numbers or value ranges
+    if cased and not lowered.islower():
+        return string
 
-    for i, regex in enumerate(_inter_wiki):
-        out = []
-        last_index = 0
-        for match in regex.finditer(string):
-            text = match.group('text')
-            # Offset by 1 to account for text group
-            index = match.groups().index(text, 1)-1
-            data = mapping[i*_MAX_RE+index][1]
+    if len(lowered) != len(string):
+        # Some characters lower case to multiple code points; leave those as
+        # they are so positions in both strings line up
+        lowered = ''.join([
+            char if len(char.lower()) != 1 else char.lower() for char in string
+        ])
+    # Don't create links within existing ones
+    spans = _get_inter_wiki_link_spans(string)
+    span_index = 0
+
+    out = []
+    append = out.append
+    last_index = 0
+    for match in regex.finditer(lowered):
+        start = match.start()
+        while span_index < len(spans) and spans[span_index][1] < start:
+            span_index += 1
+        if span_index < len(spans) and spans[span_index][0] <= start:
+            continue
+
+        text_start, text_end = match.span('text')
+        text = string[text_start:text_end]
+        link = links[_get_inter_wiki_index(match, literals, gems, fallbacks)]
+
+        # Text in front of the match and the link are emitted in one go
+        if text == link:
+            append('%s[[%s]]' % (string[last_index:text_start], link))
+        else:
+            append('%s[[%s|%s]]' % (string[last_index:text_start], link, text))
 
-            out.append(string[last_index:match.start('text')])
-            if text == data['link']:
-                out.append('[[%s]]' % data['link'])
-            else:
-                out.append('[[%s|%s]]' % (data['link'], text))
+        last_index = text_end
 
-            last_index = match.end('text')
+    if not out:
+        return string
 
-        out.append(string[last_index:])
-        string = ''.join(out)
+    append(string[last_index:])
 
-    return string
+    return ''.join(out)
 
 
 def find_template(wikitext, template_name):
@@ -1240,24 +1047,7 @@ def find_template(wikitext, template_name):
             appeared in the wikitext
 
     """
-    def f(scanner, result, tid):
-        return tid, scanner.match, result
-
-    scanner = re.Scanner([
-        # Need to have this look ahead to avoid matching templates that start
-        # with the same name.
-        (r'{{%s(?=[^\w}\|]*\||}})' % template_name,
-            partial(f, tid='template')),
-        (r'{{', partial(f, tid='l_brace')),
-        (r'}}', partial(f, tid='r_brace')),
-        (r'\[\[', partial(f, tid='l_brackets')),
-        (r'\]\]', partial(f, tid='r_brackets')),
-        (r'\|', partial(f, tid='pipe')),
-        (r'=', partial(f, tid='equals')),
-        (r'[{}]{1}', partial(f, tid='single_brace')),
-        (r'[\[\]]{1}', partial(f, tid='single_bracket')),
-        (r'[^{}\|=\[\]]+', partial(f, tid='text')),
-    ], re.UNICODE | re.MULTILINE)
+    tokens = _get_find_template_re(template_name).finditer(wikitext)
 
     # Returns
     texts = [[], ]
@@ -1269,9 +1059,12 @@ def find_template(wikitext, template_name):
     pre_equal = True
     brace_count = 0
     bracket_count = 0
-    template_argument = ['', '']
+    # Parts of the argument name and value
+    template_argument = ([], [])
 
-    for tid, match, text in scanner.scan(wikitext)[0]:
+    for match in tokens:
+        tid = match.lastgroup
+        text = match.group()
         if tid == 'template':
             in_template = True
         elif in_template:
@@ -1281,20 +1074,19 @@ def find_template(wikitext, template_name):
             if tid in ('pipe', 'r_brace') and brace_count == 0 and \
                             bracket_count == 0:
                 pre_equal = True
-                for i in range(0, 2):
-                    template_argument[i] = template_argument[i].strip(' \n')
-
-                if template_argument[1]:
-                    kw_arguments[template_argument[0]] = \
-                        template_argument[1]
-                elif template_argument[0]:
-                    arguments.append([template_argument[0]])
-                template_argument = ['', '']
+                key = ''.join(template_argument[0]).strip(' \n')
+                value = ''.join(template_argument[1]).strip(' \n')
+
+                if value:
+                    kw_arguments[key] = value
+                elif key:
+                    arguments.append([key])
+                template_argument = ([], [])
             elif tid in ('text', 'l_brace', 'r_brace', 'single_brace', 'pipe',
                          'l_brackets', 'r_brackets', 'single_bracket') or (
                     tid == 'equals' and brace_count >= 1):
                 index = 0 if pre_equal else 1
-                template_argument[index] += text
+                template_argument[index].append(text)
             elif tid == 'equals' and brace_count == 0:
                 pre_equal = False
 
@@ -1321,6 +1113,28 @@ def find_template(wikitext, template_name):
     return {'texts': texts, 'args': arguments, 'kwargs': kw_arguments}
 
 
+@lru_cache(maxsize=128)
+def _get_find_template_re(template_name):
+    # Every character is covered by one of the alternatives, so iterating over
+    # the matches yields the whole text as consecutive tokens named by the
+    # group that matched
+    return re.compile(
+        # Need to have this look ahead to avoid matching templates that start
+        # with the same name.
+        r'(?P<template>{{%s(?=[^\w}\|]*\||}}))'
+        r'|(?P<l_brace>{{)'
+        r'|(?P<r_brace>}})'
+        r'|(?P<l_brackets>\[\[)'
+        r'|(?P<r_brackets>\]\])'
+        r'|(?P<pipe>\|)'
+        r'|(?P<equals>=)'
+        r'|(?P<single_brace>[{}]{1})'
+        r'|(?P<single_bracket>[\[\]]{1})'
+        r'|(?P<text>[^{}\|=\[\]]+)' % template_name,
+        re.UNICODE | re.MULTILINE,
+    )
+
+
 def parse_and_handle_description_tags(rr, text):
     """
     Parses and handles description texts
@@ -1338,4 +1152,13 @@ def parse_and_handle_description_tags(rr, text):
         Parsed texts with wiki templates/links
     """
     return parse_description_tags(text).handle_tags(
-        TagHandler(rr).tag_handlers).replace('\n', '<br>').replace('\r', '')
+        _get_tag_handler(rr).tag_handlers
+    ).replace('\n', '<br>').replace('\r', '')
+
+
+@lru_cache(maxsize=1)
+def _get_tag_handler(rr):
+    # Exports parse descriptions using the same RelationalReader over and over,
+    # so reuse the handler instead of rebuilding the indexes and handlers for
+    # every text. Only the last one is kept to not hold on to old readers.
+    return TagHandler(rr)
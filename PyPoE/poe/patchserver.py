@@ -53,13 +53,18 @@ Internal API
 
 # Python
 import socket
-import select
 import struct
-import io
 import os
+import shutil
+import threading
+from http.client import BadStatusLine, HTTPConnection, HTTPSConnection
 from urllib import request
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from binascii import hexlify
 from hashlib import sha256
 from hmac import compare_digest
 
@@ -76,15 +81,48 @@ from PyPoE.shared.murmur2 import murmur2_32
 
 __all__ = []
 
+# Fixed size fields of the patch server responses
+_UINT8 = struct.Struct('B')
+_ITEM_COUNT = struct.Struct('>I')
+# 2 byte item type header
+# 1 byte item name length in utf-16 characters
+_ITEM_HEAD = struct.Struct('2sB')
+# 4 byte unsigned int item size in bytes
+# 32 byte sha256 item checksum
+_ITEM_SIZE_HASH = struct.Struct('>I32s')
+
 # =============================================================================
 # Functions
 # =============================================================================
 
+def _sha256_bytes(hash):
+    """
+    Get an expected SHA256 hash as bytes.
+
+    GGPK records store the hash as int, patch server records as bytes.
+
+    Parameters
+    ---------
+    hash : int or bytes
+        The SHA256 hash of a record
+
+    Returns
+    ------
+    bytes
+        32 byte SHA256 hash
+    """
+    if isinstance(hash, int):
+        return hash.to_bytes(32, byteorder='big')
+    return hash
+
 def socket_fd_open(socket_fd):
     """
     Create a TCP/IP socket object from a
     :meth:`socket.socket.detach` file descriptor.
-    Uses :func:`socket.fromfd`.
+
+    The socket takes over the file descriptor instead of duplicating it like
+    :func:`socket.fromfd` would, so either :meth:`socket.socket.detach` it
+    again or close the socket when done.
 
     Parameters
     ---------
@@ -96,11 +134,11 @@ def socket_fd_open(socket_fd):
     socket : :mod:`socket`
     """
 
-    # open new socket from fd
-    sock = socket.fromfd(fd=socket_fd,
-                         family=socket.AF_INET,
+    # open new socket on top of the fd
+    sock = socket.socket(family=socket.AF_INET,
                          type=socket.SOCK_STREAM,
-                         proto=socket.IPPROTO_TCP)
+                         proto=socket.IPPROTO_TCP,
+                         fileno=socket_fd)
     return sock
 
 def socket_fd_close(socket_fd):
@@ -108,6 +146,8 @@ def socket_fd_close(socket_fd):
     Shutdown (FIN) and close a TCP/IP socket object from a
     :meth:`socket.socket.detach` file descriptor.
 
+    The file descriptor is closed as well and must not be used afterwards.
+
     Parameters
     ---------
     socket_fd : fd
@@ -174,8 +214,8 @@ def node_check_hash(directory_node, folder_path=None, ggpk=None,
             node_patchserver = patch_file_list.directory[node_path]
             node_file_hash = child[1]
             hash_test = compare_digest(
-                node_file_hash.hexdigest(),
-                format(node_patchserver.record.hash, '064x'))
+                node_file_hash.digest(),
+                node_patchserver.record.hash)
 
             node_patchserver_results.append(hash_test)
 
@@ -262,8 +302,8 @@ def node_check_hash(directory_node, folder_path=None, ggpk=None,
             node_hash = file_hash
             del file_hash
 
-            hash_test = compare_digest(node_hash.hexdigest(),
-                                       format(self.record.hash, '064x'))
+            hash_test = compare_digest(node_hash.digest(),
+                                       _sha256_bytes(self.record.hash))
 
             file_handle.close()
             del file_handle
@@ -306,8 +346,8 @@ def node_check_hash(directory_node, folder_path=None, ggpk=None,
             folder_hash_concat = b''.join(
                 item[1].digest() for item in child_hash_list)
             node_hash = sha256(folder_hash_concat)
-            hash_test = compare_digest(node_hash.hexdigest(),
-                                       format(self.record.hash, '064x'))
+            hash_test = compare_digest(node_hash.digest(),
+                                       _sha256_bytes(self.record.hash))
         # put folder hash at end of list if recurse and not root
         if self.record is not None and recurse:
             return hash_list + [(self, node_hash, hash_test)]
@@ -385,17 +425,15 @@ def node_outdated_files(patch_file_list, directory_node_path,
     # walk metadata
     if recurse:
         directories = directory_node.directories
-        end_directories = []
         while directories:
-            child = directories.pop()
-            # if child is directory
-            if isinstance(child.record, DirectoryRecord):
-                # if metadata is not present
-                if not child.children:
-                    patch_file_list.update_filelist([child.get_path()])
-                directories = directories + child.directories
-                if not child.directories:
-                    end_directories.append(child)
+            # Query all directories of a level without metadata at once,
+            # the patch server answers them in order on the same connection
+            folders = [child.get_path() for child in directories
+                       if not child.children]
+            if folders:
+                patch_file_list.update_filelist(folders)
+            directories = [directory for child in directories
+                           for directory in child.directories]
 
     node_hash_list = node_check_hash(directory_node,
                                      folder_path=folder_path,
@@ -464,13 +502,14 @@ def node_update_files(patch_file_list, directory_node_path,
                                         recurse=recurse,
                                         bufsize=bufsize)
 
-    from json import dump
+    from json import dumps
     dump_dict = patch_file_list.directory.get_dict()
     dump_dict['version'] = patch_file_list.patch.version
     file_handle = open(os.path.join(folder_path,
                                     'poe_file_details.json'),
                        'w', encoding='utf-8')
-    dump(dump_dict, file_handle)
+    # dumps uses the C encoder, dump streams through the pure Python one
+    file_handle.write(dumps(dump_dict, separators=(',', ':')))
     file_handle.close()
 
     dir_fd = os.open(folder_path, os.O_DIRECTORY)
@@ -479,7 +518,7 @@ def node_update_files(patch_file_list, directory_node_path,
     files_count = len(download_list.keys())
     download_index = 0
     for hash, nodes in download_list.items():
-        pretty_hash = format(hash, '064x')
+        pretty_hash = hexlify(hash).decode('ascii')
         dst_file = os.path.join(folder_path, files_subdir, pretty_hash)
         node_file_name = nodes[0].get_path()
         print("{} file downloads remaining".format(
@@ -557,14 +596,29 @@ class Patch(object):
             Port to use when connecting to the master patching server
         """
         self._master_server = (master_server, master_port)
+        # Idle kept alive HTTP connections to the patch hosts,
+        # list by (scheme, host)
+        self._http_connections = {}
+        self._http_connections_lock = threading.Lock()
+        # Proxies from the environment, requests to those go through urllib
+        self._http_proxies = request.getproxies()
+        # Directories already created by download
+        self._created_dirs = set()
         self.update_patch_urls()
 
     def __del__(self):
         """
         Automatically close the patchserver connection and socket.
         """
+        for connections in getattr(self, '_http_connections', {}).values():
+            for connection in connections:
+                connection.close()
+
+        if getattr(self, 'sock_fd', None) is None:
+            return
 
         sock = socket_fd_open(self.sock_fd)
+        self.sock_fd = None
         try:
             sock.shutdown(socket.SHUT_RDWR)
         except OSError:
@@ -590,24 +644,34 @@ class Patch(object):
         """
         with socket.socket(proto=socket.IPPROTO_TCP) as sock:
             sock.connect(self._master_server)
+            # Small request/response queries, don't hold them back (Nagle)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             sock.send(Patch._PROTO)
-            data = io.BytesIO(sock.recv(1024))
+            data = sock.recv(1024)
 
-            unknown = struct.unpack('B', data.read(1))[0]
-            blank = struct.unpack('33s', data.read(33))[0]
+            # 1 byte unknown
+            # 33 bytes blank
+            data_pos = 34
 
-            url_length = struct.unpack('B', data.read(1))[0]
-            self.patch_url = data.read(url_length*2).decode('utf-16')
+            url_length = data[data_pos] * 2
+            data_pos += 1
+            self.patch_url = data[
+                data_pos:data_pos + url_length].decode('utf-16')
+            data_pos += url_length
 
-            blank = struct.unpack('B', data.read(1))[0]
+            # 1 byte blank
+            data_pos += 1
 
-            url2_length = struct.unpack('B', data.read(1))[0]
-            self.patch_cdn_url = data.read(url2_length*2).decode('utf-16')
+            url2_length = data[data_pos] * 2
+            data_pos += 1
+            self.patch_cdn_url = data[
+                data_pos:data_pos + url2_length].decode('utf-16')
 
             # Close this later!
             self.sock_fd = sock.detach()
 
-    def download(self, file_path, dst_dir=None, dst_file=None):
+    def download(self, file_path, dst_dir=None, dst_file=None,
+                 bufsize=2**16):
         """
         Downloads the file at the specified path from the patching server.
 
@@ -633,6 +697,8 @@ class Patch(object):
             ``C:/HelloWorld.txt``
 
             Mutually exclusive with the ``'dst_dir`` argument.
+        bufsize : int
+            The size of the chunks the file is written to disk in
 
         Raises
         ------
@@ -649,16 +715,24 @@ class Patch(object):
             raise ValueError('Either dst_dir or dst_file must be set')
 
         # Make any intermediate dirs to avoid errors
-        os.makedirs(os.path.split(write_path)[0], exist_ok=True)
+        write_dir = os.path.split(write_path)[0]
+        if write_dir not in self._created_dirs:
+            os.makedirs(write_dir, exist_ok=True)
+            self._created_dirs.add(write_dir)
 
-        # As per manual, writing should automatically find the optimal buffer
-        with open(write_path, mode='wb') as f:
-            f.write(self.download_raw(file_path))
+        # Stream the response to disk instead of holding the whole file
+        with self._http_get(file_path) as response, \
+                open(write_path, mode='wb') as f:
+            shutil.copyfileobj(response, f, bufsize)
 
     def download_raw(self, file_path):
         """
         Downloads the raw bytes.
 
+        Requests are sent over kept alive connections to the patch host.
+        Redirects and proxies configured through the environment (e.g.
+        ``http_proxy``) are handled by :func:`urllib.request.urlopen` instead.
+
         Parameters
         ----------
         file_path : str
@@ -669,25 +743,214 @@ class Patch(object):
         bytes
             the raw contents of the file in bytes
 
+        Raises
+        ------
+        urllib.error.HTTPError
+            if the HTTP status code is an error code
+        ValueError
+            if the HTTP status code is not 200 (and it wasn't raised by urllib)
+        """
+        with self._http_get(file_path) as response:
+            return response.read()
+
+    def download_many(self, file_paths, dst_dir, max_workers=8):
+        """
+        Downloads the files at the specified paths from the patching server
+        in parallel.
+
+        Parameters
+        ----------
+        file_paths : iterable[str]
+            paths of the files relative to the content.ggpk root directory
+        dst_dir : str
+            Write the files to the specified directory, see :meth:`download`
+        max_workers : int
+            The maximum number of simultaneous downloads
+
         Raises
         ------
         ValueError
             if the HTTP status code is not 200 (and it wasn't raised by urllib)
         """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.download, file_path, dst_dir=dst_dir)
+                for file_path in file_paths
+            ]
+            # Raise the first failed download
+            for future in futures:
+                future.result()
+
+    @contextmanager
+    def _http_get(self, file_path):
+        """
+        Sends a GET request for the file, see :meth:`_http_open`.
+
+        Context manager; tries the alternate patch urls if the connection is
+        refused.
+
+        Parameters
+        ----------
+        file_path : str
+            path of the file relative to the content.ggpk root directory
+
+        Returns
+        -------
+        http.client.HTTPResponse
+            the response with HTTP status code 200
+
+        Raises
+        ------
+        urllib.error.HTTPError
+            if the HTTP status code is an error code
+        ValueError
+            if the HTTP status code is not 200
+        """
         hosts = [self.patch_url]
         for index, host in enumerate(hosts):
+            with ExitStack() as stack:
+                try:
+                    response = stack.enter_context(
+                        self._http_open("%s%s" % (host, file_path)))
+                except (ConnectionRefusedError, URLError) as error:
+                    # try alternate patch url if connection refused
+                    if ((isinstance(error, URLError) and not isinstance(
+                            error.reason, ConnectionRefusedError))
+                            or index + 1 >= len(hosts)):
+                        raise
+                    continue
+                yield response
+                return
+
+    @contextmanager
+    def _http_open(self, url):
+        """
+        Sends a GET request for the url over a kept alive connection.
+
+        Context manager; the connection is returned for reuse on exit if the
+        response was read completely.
+
+        Urls that go through a proxy and redirects are opened with
+        :meth:`_urlopen` instead.
+
+        Parameters
+        ----------
+        url : str
+            the url to request
+
+        Returns
+        -------
+        http.client.HTTPResponse
+            the response with HTTP status code 200
+
+        Raises
+        ------
+        urllib.error.HTTPError
+            if the HTTP status code is an error code
+        ValueError
+            if the HTTP status code is not 200
+        """
+        url_split = urlsplit(url)
+        if (url_split.scheme in self._http_proxies
+                and not request.proxy_bypass(url_split.netloc)):
+            with self._urlopen(url) as response:
+                yield response
+            return
+
+        key = (url_split.scheme, url_split.netloc)
+        connection, response = self._http_request(key, url_split.path)
+        location = None
+        try:
+            if response.status != 200:
+                # Drain the body, so the connection can be reused
+                response.read()
+                if response.status >= 400:
+                    raise HTTPError(url, response.status, response.reason,
+                                    response.headers, None)
+                location = response.getheader('Location')
+                if not (300 <= response.status < 400 and location):
+                    raise ValueError(
+                        'HTTP response code: %s' % response.status)
+            else:
+                yield response
+        finally:
+            # A partially read response can't share the connection
+            if not response.isclosed():
+                connection.close()
+            with self._http_connections_lock:
+                self._http_connections[key].append(connection)
+
+        if location is not None:
+            # Follow the redirect, and any further ones, through urllib
+            with self._urlopen(urljoin(url, location)) as response:
+                yield response
+
+    @contextmanager
+    def _urlopen(self, url):
+        """
+        Sends a GET request for the url with :func:`urllib.request.urlopen`.
+
+        Context manager; used for proxies and redirects, which urllib handles.
+
+        Parameters
+        ----------
+        url : str
+            the url to request
+
+        Returns
+        -------
+        http.client.HTTPResponse
+            the response with HTTP status code 200
+
+        Raises
+        ------
+        urllib.error.HTTPError
+            if the HTTP status code is an error code
+        ValueError
+            if the HTTP status code is not 200 (and it wasn't raised by urllib)
+        """
+        with request.urlopen(url) as response:
+            if response.getcode() != 200:
+                raise ValueError('HTTP response code: %s' % response.getcode())
+            yield response
+
+    def _http_request(self, key, path):
+        """
+        Sends a GET request on an idle connection to the host, or a new one.
+
+        Parameters
+        ----------
+        key : tuple
+            (scheme, host) of the url to request
+        path : str
+            path of the url to request
+
+        Returns
+        -------
+        tuple
+            (:class:`http.client.HTTPConnection`,
+            :class:`http.client.HTTPResponse`)
+        """
+        with self._http_connections_lock:
+            connections = self._http_connections.setdefault(key, [])
+            connection = connections.pop() if connections else None
+
+        if connection is not None:
             try:
-                with request.urlopen(
-                    url="%s%s" % (host, file_path),
-                ) as robj:
-                    if robj.getcode() != 200:
-                        raise ValueError('HTTP response code: %s' % robj.getcode())
-                    return robj.read()
-            except URLError as url_error:
-                # try alternate patch url if connection refused
-                if (not isinstance(url_error.reason, ConnectionRefusedError)
-                    or not index < len(hosts)):
-                    raise url_error
+                connection.request('GET', path)
+                return connection, connection.getresponse()
+            except (BadStatusLine, ConnectionResetError,
+                    BrokenPipeError):
+                # The host closed the idle connection, open a new one
+                connection.close()
+
+        scheme, host = key
+        if scheme == 'https':
+            connection = HTTPSConnection(host)
+        else:
+            connection = HTTPConnection(host)
+        connection.request('GET', path)
+        return connection, connection.getresponse()
 
     @property
     def version(self):
@@ -808,13 +1071,18 @@ class PatchFileList(object):
         Store socket, to use single connection for multiple queries.
     sock_timeout : float
         Socket timeout value in seconds, for :meth:`socket.socket.settimeout`.
-    data : :class:`io.BytesIO`
+    data : bytearray
         Store server_data from socket, for processing in multiple methods.
+    data_pos : int
+        Read position (cursor) in :attr:`.data`.
     directory : :class:`.DirectoryNodeExtended`
         Store patch file list data as :class:`PyPoE.poe.file.ggpk.DirectoryNode`
     """
     _PROTO_PRE = b'\x03\x00'
     _PROTO_HEADER2 = b'\x04\x00'
+    # The amount of data to pull from socket each recv
+    # Amount recv will be < network MTU
+    _RECV_SIZE = 2048
 
     def __init__(self, patch, socket_timeout=1.0):
         """
@@ -833,7 +1101,10 @@ class PatchFileList(object):
         # Want socket fd details from Patch instance
         self.sock = socket_fd_open(patch.sock_fd)
         self.sock_timeout = socket_timeout
-        self.data = bytes
+        self.data = bytearray()
+        self.data_pos = 0
+        # Reused for every recv on this connection
+        self._recv_buffer = memoryview(bytearray(self._RECV_SIZE))
 
         self.directory = DirectoryNodeExtended(None, None, None)
 
@@ -866,46 +1137,47 @@ class PatchFileList(object):
         EOFError
             If the TCP stream returned by the patch server ends unexpectedly
         """
-        # The amount of data to pull from socket each recv
-        # Amount recv will be < network MTU
-        bufsize = 2048
-        # Need to be able to set data, which is used by other methods
-        data_stream = self.data
-        # Need details of socket
-        sock = self.sock
-        # Get the seek (cursor) position of data
-        data_current = data_stream.tell()
-        recv_attempts = 0
-        while True:
-            # no single value should be long enough to be broken
-            # over more than 1 TCP packet
-            if recv_attempts > 1:
-                raise EOFError('Too many attempts to pull data'
+        data_start = self.data_pos
+        data_end = data_start + read_length
+        data = self._recv_until(data_end)
+        self.data_pos = data_end
+        return bytes(data[data_start:data_end])
+
+    def _recv_until(self, data_length):
+        """
+        Get and save data from :attr:`.sock` until :attr:`.data` holds at
+        least data_length bytes.
+
+        Parameters
+        ---------
+        data_length : int
+            Minimum length of :attr:`.data`
+
+        Returns
+        ------
+        bytearray
+            :attr:`.data`
+
+        Raises
+        -----
+        EOFError
+            If the TCP stream returned by the patch server ends unexpectedly
+        """
+        data = self.data
+        recv_buffer = self._recv_buffer
+        # Append more data from the socket until the length is met,
+        # the socket timeout marks the end of the server's response
+        while len(data) < data_length:
+            try:
+                received = self.sock.recv_into(recv_buffer)
+            except socket.timeout:
+                raise EOFError('Timed out waiting for more data'
                                + ' when expecting more data')
-            # Attempt to read length asked for
-            data_read = data_stream.read(read_length)
-            recv_attempts += 1
-            # If less data than expected
-            if len(data_read) < read_length:
-                # Check if there is more data waiting in the socket
-                # And that data waiting is not an empty TCP packet
-                sockets_ready = select.select([sock], [], [], 0)
-                if (len(sockets_ready) < 1
-                    or len(sock.recv(1, socket.MSG_PEEK)) < 1):
-                    # If there is no more data, something is wrong
-                    raise EOFError('Reached end of TCP stream'
-                                   + ' when expecting more data')
-                # Otherwise, create a new data stream with
-                # all existing data + data pulled from socket
-                data_stream.seek(0)
-                data_all = data_stream.read() + sock.recv(bufsize)
-                data_stream = io.BytesIO(data_all)
-                data_stream.seek(data_current)
-                # Set instance data, for access from other methods
-                self.data = data_stream
-            else:
-                break
-        return data_read
+            if received == 0:
+                raise EOFError('Reached end of TCP stream'
+                               + ' when expecting more data')
+            data += recv_buffer[:received]
+        return data
 
     def extract_varchar(self):
         """
@@ -918,7 +1190,7 @@ class PatchFileList(object):
             extracted variable length string
         """
         # First bytes tells length of string
-        varchar_length = struct.unpack('B', self.read(1))[0]
+        varchar_length = _UINT8.unpack(self.read(1))[0]
         # String encoded utf-16 is 2*string length bytes
         varchar_length_blob = varchar_length * 2
         # Sometimes (root), length is 0, string is empty
@@ -964,15 +1236,14 @@ class PatchFileList(object):
         if len(set(folders)) != len(folders):
             raise ValueError('folder list contains non unique folder')
 
-        folder_query = b''
+        query_parts = []
         for folder in folders:
             if folder == '':
                 if len(folders) > 1:
                     raise ValueError('if querying root,'
                                      + 'only root allowed')
                 # query root folder (0 length folder name)
-                folder_query = (PatchFileList._PROTO_PRE
-                                + b'\x00')
+                query_parts += (PatchFileList._PROTO_PRE, b'\x00')
             else:
                 # test if folder is known
                 try:
@@ -984,24 +1255,33 @@ class PatchFileList(object):
                                      + ' Must traverse patchserver'
                                      + ' top (root) to bottom')
 
-                query_folder_length = struct.pack('B', len(folder))
-                query_folder_name = folder.encode('utf-16le')
-                query_folder = (PatchFileList._PROTO_PRE
-                                + query_folder_length
-                                + query_folder_name)
-                folder_query += query_folder
+                query_parts += (PatchFileList._PROTO_PRE,
+                                 _UINT8.pack(len(folder)),
+                                 folder.encode('utf_16_le'))
+        folder_query = b''.join(query_parts)
 
         sock = self.sock
-        sock.send(folder_query)
+        sock.sendall(folder_query)
         sock.settimeout(self.sock_timeout)
-        sock_data = sock.recv(2048)
-        data = io.BytesIO(sock_data)
         # Set instance data, so that it can be modified by other methods
-        self.data = data
+        self.data = bytearray()
+        self.data_pos = 0
+
+        # Local names for the item loop
+        item_head_unpack = _ITEM_HEAD.unpack_from
+        item_head_size = _ITEM_HEAD.size
+        item_size_hash_unpack = _ITEM_SIZE_HASH.unpack_from
+        item_size_hash_size = _ITEM_SIZE_HASH.size
+        recv_until = self._recv_until
+        # Record class by item type header
+        item_records = {
+            b'\x00\x00': VirtualFileRecord,
+            b'\x01\x00': VirtualDirectoryRecord,
+        }
 
         for folder in folders:
             # patch proto 4 decode
-            query_header = struct.unpack('2s', self.read(2))[0]
+            query_header = self.read(2)
             query_folder_name = ''
             folder_name = ''
             if query_header != PatchFileList._PROTO_HEADER2:
@@ -1011,52 +1291,54 @@ class PatchFileList(object):
 
             folder_name = self.extract_varchar()
 
-            item_count = struct.unpack('>I', self.read(4))[0]
+            item_count = _ITEM_COUNT.unpack(self.read(4))[0]
 
             print('{} items in directory {}'
                   .format(item_count, folder_name))
 
             parent = self.directory[folder]
 
-            folder_directory_nodes = []
+            # item_count is known, fill a preallocated list
+            folder_directory_nodes = [None] * item_count
 
+            # Walk the item records with a local cursor over the buffered
+            # data, only going back to the socket when a record is short
+            data = self.data
+            data_pos = self.data_pos
             for item in range(0, item_count):
-                header = struct.unpack('2s', self.read(2))[0]
-                if header == b'\x00\x00':
-                    tag = 'FILE'
-                elif header == b'\x01\x00':
-                    tag = 'PDIR'
-                else:
+                if len(data) < data_pos + item_head_size:
+                    data = recv_until(data_pos + item_head_size)
+                header, name_length = item_head_unpack(data, data_pos)
+                data_pos += item_head_size
+                # String encoded utf-16 is 2*string length bytes
+                name_end = data_pos + name_length * 2
+                item_end = name_end + item_size_hash_size
+                if len(data) < item_end:
+                    data = recv_until(item_end)
+
+                record_class = item_records.get(header)
+                if record_class is None:
                     raise KeyError('Unknown patch server'
                                    + ' item type:'
                                    + ' {} from query: {}'
                                    .format(header, folder_query))
 
-                name = self.extract_varchar()
+                name = data[data_pos:name_end].decode('utf-16')
 
-                # 4 byte unsigned int item size in bytes
-                # 32 byte sha256 item checksum
-                size, sha256sum = struct.unpack(
-                    '>I32s', self.read(36))
+                size, sha256sum = item_size_hash_unpack(data, name_end)
+                data_pos = item_end
 
-                # store sha256sum as int
-                sha256sum = int.from_bytes(sha256sum, byteorder='big')
-
-                if tag == DirectoryRecord.tag:
-                    temp_record = VirtualDirectoryRecord(
-                        name=name,
-                        hash=sha256sum)
-                elif tag == FileRecord.tag:
-                    temp_record = VirtualFileRecord(
-                        name=name,
-                        hash=sha256sum,
-                        size=size)
+                if record_class is VirtualFileRecord:
+                    temp_record = VirtualFileRecord(name, sha256sum, size)
+                else:
+                    temp_record = record_class(name, sha256sum)
 
-                folder_directory_nodes.append(DirectoryNodeExtended(
-                    record=temp_record,
-                    hash=murmur2_32(name.lower().encode('utf-16le')),
-                    parent=parent))
+                folder_directory_nodes[item] = DirectoryNodeExtended(
+                    temp_record,
+                    murmur2_32(name.lower().encode('utf_16_le')),
+                    parent)
 
+            self.data_pos = data_pos
             parent.children = folder_directory_nodes
 
 class BaseRecordData(ReprMixin):
@@ -1073,7 +1355,7 @@ class BaseRecordData(ReprMixin):
     ---------
     _name :  str
         Name of item
-    hash :  int
+    hash :  bytes
         SHA256 hash of file contents
     """
     def __init__(self, name, hash):
@@ -1082,12 +1364,18 @@ class BaseRecordData(ReprMixin):
 
 class VirtualDirectoryRecord(BaseRecordData,
                              DirectoryRecord):
+    # type in :meth:`DirectoryNodeExtended.get_dict`
+    _dict_type = 'folder'
+
     def __init__(self, *args, **kwargs):
         super(VirtualDirectoryRecord,
               self).__init__(*args, **kwargs)
 
 class VirtualFileRecord(BaseRecordData,
                         FileRecord):
+    # type in :meth:`DirectoryNodeExtended.get_dict`
+    _dict_type = 'file'
+
     def __init__(self, name, hash, size):
         self.data_length = size
         super(VirtualFileRecord,
@@ -1102,6 +1390,9 @@ class DirectoryNodeExtended(DirectoryNode):
 
         :meth:`.gen_walk`
     """
+    # No per node __dict__, like DirectoryNode
+    __slots__ = []
+
     def __init__(self, *args, **kwargs):
         super(DirectoryNodeExtended,
               self).__init__(*args, **kwargs)
@@ -1113,11 +1404,11 @@ class DirectoryNodeExtended(DirectoryNode):
 
         Example::
 
-            from json import dump
+            from json import dumps
             dump_dict = patch_file_list.directory.get_dict()
             dump_dict['version'] = patch_file_list.patch.version
             file_handle = open('poe_file_details.json', 'w', encoding='utf-8')
-            dump(dump_dict, file_handle)
+            file_handle.write(dumps(dump_dict, separators=(',', ':')))
             file_handle.close()
 
         Parameters
@@ -1140,29 +1431,24 @@ class DirectoryNodeExtended(DirectoryNode):
                 Folders have children[]
         """
         record_dict = OrderedDict()
+        record = self.record
 
-        if isinstance(self.record, BaseRecordData):
-            record_dict['name'] = self.record._name
+        if isinstance(record, BaseRecordData):
+            record_dict['name'] = record._name
 
-            pretty_hash = format(self.record.hash, '064x')
+            pretty_hash = hexlify(record.hash).decode('ascii')
             record_dict['hash'] = pretty_hash
 
-            if isinstance(self.record, VirtualDirectoryRecord):
-                record_dict['type'] = 'folder'
-            elif isinstance(self.record, VirtualFileRecord):
-                record_dict['type'] = 'file'
-                record_dict['size'] = self.record.data_length
+            dict_type = record._dict_type
+            record_dict['type'] = dict_type
+            if dict_type == 'file':
+                record_dict['size'] = record.data_length
         else:
             record_dict['name'] = 'ROOT'
 
-
-        if recurse is True:
-            if len(self.children) > 1:
-                children = []
-                record_dict['children'] = children
-
-                for child in self.children:
-                    children.append(child.get_dict())
+        if recurse is True and self.children:
+            record_dict['children'] = [
+                child.get_dict() for child in self.children]
 
         return record_dict
 
@@ -1184,63 +1470,62 @@ class DirectoryNodeExtended(DirectoryNode):
             Ordered dict from :meth:`DirectoryNodeExtended.get_dict`
 
         """
-        if not isinstance(node_dict, OrderedDict):
-            raise TypeError('OrderedDict required')
-
-        node_children = []
-
-        node_name = node_dict['name']
-        if node_name == 'ROOT':
-            temp_record = None
-            node_hash = None
-        else:
-            node_type = node_dict['type']
+        # explicit stack instead of a recursive call per node
+        stack = [(node_dict, parent)]
+        while stack:
+            node_dict, parent = stack.pop()
+            if not isinstance(node_dict, OrderedDict):
+                raise TypeError('OrderedDict required')
+
+            node_name = node_dict['name']
+            if node_name == 'ROOT':
+                temp_record = None
+                node_hash = None
+            else:
+                node_type = node_dict['type']
 
-            # unpretty hash. str hex bytes -> bytes
-            pretty_hash = node_dict['hash']
-            # store sha256sum as int
-            node_hash = int(pretty_hash, 16)
+                # unpretty hash. str hex bytes -> bytes
+                pretty_hash = node_dict['hash']
+                node_hash = bytes.fromhex(pretty_hash)
 
-            if node_type == 'file':
-                node_file_size = node_dict['size']
+                if node_type == 'file':
+                    node_file_size = node_dict['size']
 
-                temp_record = VirtualFileRecord(
-                    name=node_name,
-                    hash=node_hash,
-                    size=node_file_size)
+                    temp_record = VirtualFileRecord(
+                        name=node_name,
+                        hash=node_hash,
+                        size=node_file_size)
 
-            elif node_type == 'folder':
-                temp_record = VirtualDirectoryRecord(
-                    name=node_name,
-                    hash=node_hash)
+                elif node_type == 'folder':
+                    temp_record = VirtualDirectoryRecord(
+                        name=node_name,
+                        hash=node_hash)
 
+                else:
+                    raise KeyError('Unknown type: {}'.format(
+                        node_type))
+
+            if parent is None:
+                self.record = temp_record
+                self.hash = node_hash
+                self.parent = None
+                child_node = self
             else:
-                raise KeyError('Unknown type: {}'.format(
-                    node_type))
-
-        if parent is None:
-            self.record = temp_record
-            self.hash = node_hash
-            self.parent = None
-            child_node = self
-        else:
-            child_node = DirectoryNodeExtended(
-                record=temp_record,
-                hash=node_name,
-                parent=parent)
-            parent.children.append(child_node)
+                child_node = DirectoryNodeExtended(
+                    record=temp_record,
+                    hash=node_name,
+                    parent=parent)
+                parent.children.append(child_node)
 
-        try:
-            node_children = node_dict['children']
+            node_children = node_dict.get('children')
             if node_children:
-                for child in node_children:
-                    child_node.load_dict(child, child_node)
-        except KeyError:
-            pass
+                # first child on top of the stack, keeps the children order
+                stack.extend([(child, child_node)
+                              for child in reversed(node_children)])
 
     def gen_walk(self, max_depth=-1, _depth=0):
         """
-        A depth first recursive generator for a DirectoryNode
+        A depth first generator for a DirectoryNode
 
         Example::
 
@@ -1263,11 +1548,17 @@ class DirectoryNodeExtended(DirectoryNode):
             (:class:`.DirectoryNodeExtended`, depth)
         """
         # only continue if not past maximum depth
-        if (max_depth == -1 or _depth <= max_depth):
-            yield (self, _depth)
-            _depth += 1
-            # don't recurse it that goes over max_depth
-            if (max_depth == -1 or _depth <= max_depth):
-                # depth first
-                for child in self.children:
-                    yield from child.gen_walk(max_depth, _depth)
+        if not (max_depth == -1 or _depth <= max_depth):
+            return
+        # explicit stack instead of a generator per node
+        stack = [(self, _depth)]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node, depth = pop()
+            yield (node, depth)
+            depth += 1
+            # don't descend if that goes over max_depth
+            if (max_depth == -1 or depth <= max_depth):
+                # depth first, first child on top of the stack
+                extend([(child, depth) for child in reversed(node.children)])
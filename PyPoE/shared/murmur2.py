@@ -62,29 +62,24 @@ def murmur2_32(byte_data, seed=DEFAULT_SEED):
     # Initialize the hash to a 'random' value
     h = (seed ^ length) & int32
 
-    # Mix 4 bytes at a time into the hash
-    index = 0
-
-    while length >= 4:
-        k = struct.unpack('<i', byte_data[index:index+4])[0]
-
+    # Mix 4 bytes at a time into the hash, unpacking all blocks at once
+    blocks = length // 4
+    for k in struct.unpack_from('<%sI' % blocks, byte_data):
         k = k * M & int32
-        k = k ^ (k >> R & int32)
+        k ^= k >> R
         k = k * M & int32
 
-        h = h * M & int32
-        h = (h ^ k) & int32
-
-        index += 4
-        length -= 4
+        h = (h * M & int32) ^ k
 
     # Handle the last few bytes of the input array
+    index = blocks * 4
+    length -= index
     if length >= 3:
-        h = (h ^ byte_data[index+2] << 16) & int32
+        h ^= byte_data[index+2] << 16
     if length >= 2:
-        h = (h ^ byte_data[index+1] << 8) & int32
+        h ^= byte_data[index+1] << 8
     if length >= 1:
-        h = (h ^ byte_data[index]) & int32
+        h ^= byte_data[index]
         h = h * M & int32
 
     # Do a few final mixes of the hash to ensure the last few bytes are
@@ -31,6 +31,7 @@ See PyPoE/LICENSE
 
 # Python
 import os
+import re
 from collections import OrderedDict
 
 # 3rd-party
@@ -104,6 +105,18 @@ iwdata = (
         '[[Item socket|Socketed]] Gems are supported by '
         '[[Stun Support|level 6 Stun]]',
     ),
+    # Nothing to link
+    (
+        '+(10-20)%',
+        '+(10-20)%',
+    ),
+    # Support gem sharing the start with another one
+    (
+        'Socketed Gems are supported by level 10 Trap and Mine Damage',
+
+        '[[Item socket|Socketed]] Gems are supported by '
+        '[[Trap and Mine Damage Support|level 10 Trap and Mine Damage]]',
+    ),
     #
     (
         'Socketed Gems are Supported by level 10 Faster Casting',
@@ -111,6 +124,32 @@ iwdata = (
         '[[Item socket|Socketed]] Gems are Supported by '
         '[[Faster Casting Support|level 10 Faster Casting]]',
     ),
+    # The longest term starting at a word wins over shorter ones
+    (
+        'vaal fireball',
+        '[[Vaal Fireball|vaal fireball]]',
+    ),
+    (
+        'vaal arc',
+        '[[Vaal Arc|vaal arc]]',
+    ),
+    # A support gem wins over the terms it is made of
+    (
+        'Level 16 Mana Leech',
+        '[[Mana Leech Support|Level 16 Mana Leech]]',
+    ),
+    # Level is linked on its own if no support gem follows
+    (
+        'Grants level 20 Vaal Arc Skill',
+        'Grants [[Level|level]] 20 [[Vaal Arc]] [[Skill]]',
+    ),
+    # Existing links must be left alone
+    (
+        'Adds [[Fire Damage|fire damage]] to Spells and Attacks',
+
+        'Adds [[Fire Damage|fire damage]] to [[Spell|Spells]] and '
+        '[[Attack|Attacks]]',
+    ),
 )
 
 # Input string, template name, other text, template args, template kwargs
@@ -250,6 +289,16 @@ def test_interwiki_linker(string, result):
     assert parser.make_inter_wiki_links(string) == result
 
 
+@pytest.mark.parametrize('strings', (
+    ['frenzy charge', 'frenzy charges', 'frenzy'],
+    ['frenzy', 'frenzy charges', 'frenzy charge'],
+))
+def test_make_trie_pattern_longest_match(strings):
+    regex = re.compile(parser._make_trie_pattern(strings))
+    for string in strings:
+        assert regex.match(string).group() == string
+
+
 @pytest.mark.parametrize('string,template,texts,args,kwargs', ftdata)
 def test_find_template(string, template, texts, args, kwargs):
     result = parser.find_template(string, template)
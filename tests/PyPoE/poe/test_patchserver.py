@@ -38,6 +38,7 @@ candidate for testing.
 # Python
 import os
 import re
+from collections import OrderedDict
 from urllib.error import HTTPError
 from socket import socket
 
@@ -100,7 +101,10 @@ def test_socket_fd_open_close(patch_temp):
     test_sock_from_fd = patchserver.socket_fd_open(patch_temp.sock_fd)
     assert isinstance(test_sock_from_fd, socket)
     sock_fd = test_sock_from_fd.detach()
+    # The socket must take over the descriptor rather than duplicating it
+    assert sock_fd == patch_temp.sock_fd
     patchserver.socket_fd_close(sock_fd)
+    patch_temp.sock_fd = None
 
 class TestPatch(object):
     def test_dst_file(self, patch, tmpdir):
@@ -132,6 +136,53 @@ class TestPatch(object):
         assert _re_version.match(patch.version) is not None, 'patch.version ' \
             'result is expected to match the x.x.x.x format'
 
+class TestDirectoryNodeExtended(object):
+    def test_get_dict_single_child(self):
+        root = patchserver.DirectoryNodeExtended(None, None, None)
+        folder = patchserver.DirectoryNodeExtended(
+            record=patchserver.VirtualDirectoryRecord(
+                name='Data', hash=b'\x01' * 32),
+            hash=None,
+            parent=root)
+        root.children.append(folder)
+        folder.children.append(patchserver.DirectoryNodeExtended(
+            record=patchserver.VirtualFileRecord(
+                name='Mods.dat', hash=b'\x02' * 32, size=5),
+            hash=None,
+            parent=folder))
+
+        node_dict = root.get_dict()
+        assert len(node_dict['children']) == 1
+        assert node_dict['children'][0]['children'] == [OrderedDict((
+            ('name', 'Mods.dat'),
+            ('hash', '02' * 32),
+            ('type', 'file'),
+            ('size', 5),
+        ))]
+
+        loaded = patchserver.DirectoryNodeExtended(None, None, None)
+        loaded.load_dict(node_dict)
+        assert loaded.get_dict() == node_dict
+
+    def test_load_dict_deep(self):
+        # deeper than the default recursion limit
+        depth = 2000
+        node_dict = OrderedDict((('name', 'ROOT'),))
+        parent_dict = node_dict
+        for index in range(depth):
+            child_dict = OrderedDict((
+                ('name', 'Folder%s' % index),
+                ('hash', '00' * 32),
+                ('type', 'folder'),
+            ))
+            parent_dict['children'] = [child_dict]
+            parent_dict = child_dict
+
+        loaded = patchserver.DirectoryNodeExtended(None, None, None)
+        loaded.load_dict(node_dict)
+        assert [node_depth for node, node_depth in loaded.gen_walk()] == list(
+            range(depth + 1))
+
 @pytest.mark.dependency(depends=["test_socket"])
 class TestPatchFileList(object):
     @pytest.mark.dependency()